@@ -145,6 +145,10 @@ class CausewayAgent:
         await self._mode2.initialize()
         self._initialized = True
 
+    async def close(self) -> None:
+        """Shut down sub-components' background resources."""
+        await self._mode1.close()
+
     # ── Public API ──────────────────────────────────────────────────
 
     async def run(
@@ -180,10 +184,13 @@ class CausewayAgent:
         )
 
         # Step 4 — Run the LLM-driven loop
-        orch_result: OrchestratorResult = await orchestrator.run(
-            query=query,
-            system_prompt=system_prompt,
-        )
+        try:
+            orch_result: OrchestratorResult = await orchestrator.run(
+                query=query,
+                system_prompt=system_prompt,
+            )
+        finally:
+            await orchestrator.close()
 
         # Step 5 — Package
         return AgentResult(
@@ -9,10 +9,12 @@ Wrapper for Google Gemini API with:
 """
 
 import asyncio
+import copy
 import json
 import logging
 import random
 import re
+import threading
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from typing import Any, Optional, Type, TypeVar
@@ -41,6 +43,103 @@ except ImportError:
 
 T = TypeVar("T", bound=BaseModel)
 
+# Inline batch jobs that have not finished by then (or by the caller's
+# ``timeout_s``) are cancelled and their requests re-issued one at a time.
+_BATCH_POLL_INTERVAL_S = 5.0
+_BATCH_TIMEOUT_S = 900.0
+_BATCH_DONE_STATES = frozenset({
+    "JOB_STATE_SUCCEEDED",
+    "JOB_STATE_PARTIALLY_SUCCEEDED",
+    "JOB_STATE_FAILED",
+    "JOB_STATE_CANCELLED",
+    "JOB_STATE_EXPIRED",
+})
+
+# One google-genai client (and therefore one pooled HTTP connection set)
+# per API key, shared by every LLMClient in the process — the judge,
+# orchestrator and mode builders no longer each pay TCP/TLS setup.
+_KEEPALIVE_FLOOR = 16
+_shared_clients: dict[str, Any] = {}
+_shared_clients_lock = threading.Lock()
+
+
+def _shared_genai_client(api_key: str, pool_size: int) -> Any:
+    """Return the process-wide ``genai.Client`` for *api_key*.
+
+    The underlying ``httpx.Client`` keeps up to *pool_size* connections
+    alive (sized from the LLM semaphore, since that bounds concurrency)
+    and speaks HTTP/2 when the optional ``h2`` package is installed.
+    """
+    with _shared_clients_lock:
+        client = _shared_clients.get(api_key)
+        if client is not None:
+            return client
+
+        import httpx
+        from google import genai
+        from google.genai import types as genai_types
+
+        try:
+            import h2  # noqa: F401
+            http2 = True
+        except ImportError:
+            http2 = False
+
+        keepalive = max(pool_size, _KEEPALIVE_FLOOR)
+        http_client = httpx.Client(
+            http2=http2,
+            timeout=httpx.Timeout(None),
+            limits=httpx.Limits(
+                max_keepalive_connections=keepalive,
+                max_connections=keepalive * 2,
+            ),
+        )
+        client = genai.Client(
+            api_key=api_key,
+            http_options=genai_types.HttpOptions(httpx_client=http_client),
+        )
+        _shared_clients[api_key] = client
+        return client
+
+
+def close_shared_clients() -> None:
+    """Close every shared Gemini client and its connection pool.
+
+    Call once at process shutdown; clients are rebuilt on next use.
+    """
+    with _shared_clients_lock:
+        clients = list(_shared_clients.values())
+        _shared_clients.clear()
+    for client in clients:
+        try:
+            client.close()
+        except Exception as exc:  # pragma: no cover - best effort
+            logger.debug("Error closing Gemini client: %s", exc)
+
+
+_JSON_STRING_RE = re.compile(r'"(?:[^"\\]|\\.)*"')
+
+
+def _is_complete_json(buf: str) -> bool:
+    """Cheap check that *buf* is a complete JSON object/array.
+
+    Used to reject truncated model output (e.g. cut off at
+    ``max_output_tokens``) before paying for ``json.loads`` and schema
+    validation.  String literals are stripped with one regex pass and
+    the brackets of the remainder are counted — no tree is built.  A
+    ``True`` result does not guarantee the text parses.
+    """
+    text = buf.strip()
+    if not text or text[0] not in "{[" or text[-1] not in "}]":
+        return False
+    skeleton = _JSON_STRING_RE.sub("", text)
+    if '"' in skeleton:         # unterminated string literal
+        return False
+    return (
+        skeleton.count("{") == skeleton.count("}")
+        and skeleton.count("[") == skeleton.count("]")
+    )
+
 
 class LLMModel(str, Enum):
     """Available LLM models."""
@@ -75,6 +174,7 @@ class LLMClient:
     
     Features:
     - Async API calls with retry
+    - One pooled HTTP connection set per API key, shared process-wide
     - Structured JSON output parsing
     - Tool/function calling
     - Mock mode for testing
@@ -94,12 +194,14 @@ class LLMClient:
         self.max_retries = max_retries
         self.timeout = timeout
         self._client = None
+        self._closed = False
         self._mock_mode = self.api_key is None
         # Read semaphore limit from VerificationConfig if not explicitly set
         if semaphore_limit is None:
-            from src.config import VerificationConfig
-            semaphore_limit = VerificationConfig().llm_semaphore_limit
+            from src.config import get_verification_config
+            semaphore_limit = get_verification_config().llm_semaphore_limit
         self._semaphore = asyncio.Semaphore(semaphore_limit)
+        self._semaphore_limit = semaphore_limit
         
         # Mock responses for testing
         self._mock_responses: list[str] = []
@@ -111,11 +213,27 @@ class LLMClient:
             return
         
         try:
-            from google import genai
-            self._genai_client = genai.Client(api_key=self.api_key)
+            self._genai_client = _shared_genai_client(self.api_key, self._semaphore_limit)
             self._client = self._genai_client
+            self._closed = False
         except ImportError:
             self._mock_mode = True
+
+    def close(self) -> None:
+        """Detach from the shared Gemini client.
+
+        Later calls raise ``RuntimeError`` until ``initialize()`` is called
+        again.  The pooled connections belong to the process-wide client
+        (other ``LLMClient`` instances may still use them); call
+        ``close_shared_clients()`` at shutdown to release them.
+        """
+        self._client = None
+        self._genai_client = None
+        self._closed = True
+
+    def _ensure_open(self) -> None:
+        if self._closed:
+            raise RuntimeError("LLMClient is closed")
     
     async def generate(
         self,
@@ -140,6 +258,7 @@ class LLMClient:
         
         if self._mock_mode:
             return self._generate_mock_response(prompt)
+        self._ensure_open()
         
         full_prompt = prompt
         if system_prompt:
@@ -278,7 +397,8 @@ Respond ONLY with the JSON, no other text."""
         output_schema: Type[T],
         system_prompt: Optional[str] = None,
         model_override: Optional[LLMModel] = None,
-    ) -> T:
+        skip_validation: bool = False,
+    ) -> T | dict[str, Any]:
         """
         Generate structured output using Gemini's native response_schema.
 
@@ -294,9 +414,15 @@ Respond ONLY with the JSON, no other text."""
             output_schema:  Pydantic model class for the response
             system_prompt:  Optional system instructions
             model_override: Use a different model (e.g. gemini-2.5-pro for judge)
+            skip_validation: Return the decoded JSON ``dict`` from the
+                native (schema-constrained) path without running Pydantic
+                validation; the caller takes responsibility for it.  Mock
+                and prompt-injection fallback results are always validated
+                and returned as models.
 
         Returns:
-            Validated instance of *output_schema*
+            Validated instance of *output_schema* (or the raw ``dict``, see
+            *skip_validation*)
         """
         if self._mock_mode:
             return await self.generate_structured(
@@ -304,6 +430,7 @@ Respond ONLY with the JSON, no other text."""
                 output_schema=output_schema,
                 system_prompt=system_prompt,
             )
+        self._ensure_open()
 
         from google.genai import types as genai_types
 
@@ -311,9 +438,8 @@ Respond ONLY with the JSON, no other text."""
         if system_prompt:
             full_prompt = f"{system_prompt}\n\n{prompt}"
 
-        # Convert Pydantic JSON Schema → Gemini-compatible schema subset
-        json_schema = output_schema.model_json_schema()
-        gemini_schema = self._jsonschema_to_gemini(json_schema)
+        # Pydantic JSON Schema → Gemini-compatible subset, once per model class
+        gemini_schema = self._response_schema(output_schema)
 
         config = genai_types.GenerateContentConfig(
             temperature=0.2,
@@ -334,6 +460,10 @@ Respond ONLY with the JSON, no other text."""
                         config=config,
                     )
 
+                if not _is_complete_json(response.text or ""):
+                    raise ValueError(
+                        f"truncated structured response ({len(response.text or '')} chars)"
+                    )
                 json_data = json.loads(response.text)
 
                 # Telemetry for structured native calls
@@ -348,6 +478,8 @@ Respond ONLY with the JSON, no other text."""
                         completion_tokens=getattr(getattr(response, 'usage_metadata', None), 'candidates_token_count', 0) or 0,
                     )
 
+                if skip_validation and isinstance(json_data, dict):
+                    return json_data
                 return output_schema.model_validate(json_data)
 
             except Exception as e:
@@ -385,6 +517,130 @@ Respond ONLY with the JSON, no other text."""
                         system_prompt=system_prompt,
                     )
 
+    async def generate_structured_batch(
+        self,
+        prompts: list[str],
+        output_schema: Type[T],
+        system_prompt: Optional[str] = None,
+        model_override: Optional[LLMModel] = None,
+        timeout_s: float = _BATCH_TIMEOUT_S,
+    ) -> list[T]:
+        """
+        Generate structured outputs for many prompts in one Gemini batch job.
+
+        Submits every prompt as an inline request via ``batches.create``
+        (Batch Mode is billed at a discount and not subject to the
+        per-minute request limit), polls until the job finishes, and
+        validates each response against *output_schema*.  Any request
+        the job did not answer — or the whole job on failure or after
+        *timeout_s* — is retried through ``generate_structured_native``.
+
+        The job takes one semaphore slot while it is created; polling is
+        not counted against the concurrency limit.
+
+        In mock mode the prompts are simply run concurrently.
+
+        Returns:
+            One validated instance per prompt, in input order
+        """
+        if self._mock_mode or len(prompts) <= 1:
+            return list(await asyncio.gather(*(
+                self.generate_structured_native(
+                    prompt=p,
+                    output_schema=output_schema,
+                    system_prompt=system_prompt,
+                    model_override=model_override,
+                )
+                for p in prompts
+            )))
+        self._ensure_open()
+
+        from google.genai import types as genai_types
+
+        gemini_schema = self._response_schema(output_schema)
+        config = genai_types.GenerateContentConfig(
+            temperature=0.2,
+            max_output_tokens=4096,
+            response_mime_type="application/json",
+            response_schema=gemini_schema,
+        )
+        target_model = (model_override or self.model).value
+        full_prompts = [
+            f"{system_prompt}\n\n{p}" if system_prompt else p for p in prompts
+        ]
+        inline_requests = [
+            genai_types.InlinedRequest(
+                contents=[genai_types.Content(role="user", parts=[genai_types.Part(text=fp)])],
+                config=config,
+            )
+            for fp in full_prompts
+        ]
+
+        results: list[Optional[T]] = [None] * len(prompts)
+        try:
+            async with self._semaphore:
+                job = await asyncio.to_thread(
+                    self._client.batches.create, model=target_model, src=inline_requests,
+                )
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + timeout_s
+            poll_interval = min(_BATCH_POLL_INTERVAL_S, timeout_s)
+            while getattr(job.state, "value", job.state) not in _BATCH_DONE_STATES:
+                if loop.time() > deadline:
+                    await asyncio.to_thread(self._client.batches.cancel, name=job.name)
+                    raise TimeoutError(f"batch job {job.name} timed out")
+                await asyncio.sleep(poll_interval)
+                job = await asyncio.to_thread(self._client.batches.get, name=job.name)
+
+            responses = (job.dest.inlined_responses or []) if job.dest else []
+            _tel = _get_telemetry() if _get_telemetry else None
+            for i, item in enumerate(responses[:len(prompts)]):
+                if (
+                    item.error or item.response is None
+                    or not _is_complete_json(item.response.text or "")
+                ):
+                    continue
+                try:
+                    results[i] = output_schema.model_validate(json.loads(item.response.text))
+                except Exception as exc:
+                    logger.warning("Batch response %d failed validation: %s", i, str(exc)[:120])
+                    continue
+                if _tel:
+                    usage = item.response.usage_metadata
+                    _tel.record_llm_call(
+                        model=target_model,
+                        prompt_chars=len(full_prompts[i]),
+                        completion_chars=len(item.response.text),
+                        latency_ms=0,  # batch jobs are not timed per request
+                        prompt_tokens=(usage.prompt_token_count or 0) if usage else 0,
+                        completion_tokens=(usage.candidates_token_count or 0) if usage else 0,
+                    )
+        except Exception as e:
+            if self._is_daily_quota_error(e):
+                raise RuntimeError(
+                    "Gemini API daily quota exhausted (free tier: 20 requests/day). "
+                    "Wait until tomorrow or upgrade to a paid plan at https://ai.google.dev/pricing"
+                ) from e
+            logger.warning(
+                "Batch of %d structured calls failed (%s) — falling back to per-call requests",
+                len(prompts), str(e)[:120],
+            )
+
+        missing = [i for i, r in enumerate(results) if r is None]
+        if missing:
+            retried = await asyncio.gather(*(
+                self.generate_structured_native(
+                    prompt=prompts[i],
+                    output_schema=output_schema,
+                    system_prompt=system_prompt,
+                    model_override=model_override,
+                )
+                for i in missing
+            ))
+            for i, r in zip(missing, retried):
+                results[i] = r
+        return results  # type: ignore[return-value]
+
     async def generate_with_tools(
         self,
         prompt: str,
@@ -406,6 +662,7 @@ Respond ONLY with the JSON, no other text."""
             response = self._generate_mock_response(prompt)
             response.tool_calls = self._extract_tool_calls(response.content)
             return response
+        self._ensure_open()
 
         from google.genai import types as genai_types
 
@@ -486,6 +743,24 @@ Respond ONLY with the JSON, no other text."""
                 else:
                     raise
 
+    # Converted response schemas keyed by Pydantic model class; the
+    # conversion is deterministic, so every call after the first is a
+    # dict lookup instead of a model_json_schema() walk.
+    _response_schemas: dict[type, dict[str, Any]] = {}
+
+    @classmethod
+    def _response_schema(cls, output_schema: Type[BaseModel]) -> dict[str, Any]:
+        """Gemini ``response_schema`` for *output_schema*, memoised per class.
+
+        Each caller gets its own deep copy, so an in-place edit (by the
+        SDK or a caller) cannot leak into later requests.
+        """
+        schema = cls._response_schemas.get(output_schema)
+        if schema is None:
+            schema = cls._jsonschema_to_gemini(output_schema.model_json_schema())
+            cls._response_schemas[output_schema] = schema
+        return copy.deepcopy(schema)
+
     @staticmethod
     def _jsonschema_to_gemini(schema: dict[str, Any]) -> dict[str, Any]:
         """
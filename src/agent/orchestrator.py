@@ -89,6 +89,10 @@ class AgentOrchestrator:
         """Initialize all components."""
         await self.llm.initialize()
         await self.retrieval.initialize()
+
+    async def close(self) -> None:
+        """Shut down background resources."""
+        await self.verifier.close()
     
     async def run(
         self,
@@ -27,7 +27,8 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 import time
 
-from src.api.routes import router
+from src.agent.llm_client import close_shared_clients
+from src.api.routes import close_services, router
 from src.config import get_settings
 from src.storage.database import init_db, get_engine
 
@@ -51,7 +52,11 @@ async def lifespan(app: FastAPI):
 
     yield
 
-    # Shutdown — dispose of the SQLAlchemy engine
+    # Shutdown — stop judge drainers and release pooled LLM connections
+    await close_services()
+    close_shared_clients()
+
+    # Dispose of the SQLAlchemy engine
     engine = get_engine()
     await engine.dispose()
     logger.info("Database engine disposed")
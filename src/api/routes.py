@@ -127,6 +127,14 @@ async def get_mode2() -> Mode2DecisionSupport:
     return _mode2
 
 
+async def close_services() -> None:
+    """Shut down the background resources of initialised services."""
+    if _causeway_agent is not None:
+        await _causeway_agent.close()
+    if _mode1 is not None:
+        await _mode1.close()
+
+
 # ===== Request/Response Models =====
 
 class DocumentResponse(BaseModel):
@@ -15,6 +15,7 @@ Provides:
 
 from __future__ import annotations
 
+import functools
 import itertools
 import logging
 import re
@@ -49,10 +50,27 @@ _logger = logging.getLogger(__name__)
 # or omit the <answer> tags entirely.  The old equality check (== "A") silently
 # dropped 5-15% of valid edges.  This normalizer handles all observed variants.
 
+# Compiled once at import: the normalizer runs for every pairwise answer.
+_ANSWER_OPEN = "<answer>"
+_ANSWER_CLOSE = "</answer>"
+_BOXED_RE = re.compile(r'\\boxed\{\s*([ABCabc])\s*\}')
+_BOLD_RE = re.compile(r'(?:\*\*|__)\s*([ABCabc])\s*(?:\*\*|__)')
+_EXPLICIT_RE = re.compile(
+    r'(?:answer|choice|option)\s*(?:is|:)\s*([ABCabc])', re.IGNORECASE,
+)
+# Match "A.", "A)", "A:", "A\n", or standalone "A" at word boundary
+_FALLBACK_RE = re.compile(r'(?:^|\W)([ABC])(?:\.|\)|:|\s|$)')
+# The pre-normalizer parse (single-line tags), kept to count recoveries.
+_STRICT_TAG_RE = re.compile(r'<answer>(.*?)</answer>')
+
+
+@functools.lru_cache(maxsize=4096)
 def _normalize_answer(raw_description: str) -> str:
     """Extract and normalize the pairwise answer from an LLM response.
 
     Returns exactly ``"A"``, ``"B"``, ``"C"``, or ``""`` (unparseable).
+    Pure, so it is memoised: templated replies such as
+    ``<answer>C</answer>`` recur across many pairs.
 
     Resolution order:
     1. ``<answer>…</answer>`` tags — take the first alphabetic character.
@@ -64,50 +82,43 @@ def _normalize_answer(raw_description: str) -> str:
         return ""
 
     # --- Primary path: <answer> tag extraction ---
-    tag_matches = re.findall(r'<answer>(.*?)</answer>', raw_description, re.DOTALL)
-    if tag_matches:
-        # Take the first tag's content, strip whitespace
-        content = tag_matches[0].strip()
-        # Extract the first A/B/C character from the content
-        letter_match = re.search(r'[ABCabc]', content)
-        if letter_match:
-            return letter_match.group(0).upper()
+    # Plain ``str.find`` for the first tag pair, then a linear letter scan.
+    start = raw_description.find(_ANSWER_OPEN)
+    if start != -1:
+        start += len(_ANSWER_OPEN)
+        # Fast path for the dominant shape, a bare ``<answer>X</answer>``.
+        letter = raw_description[start:start + 1]
+        if letter and letter in "ABCabc" and raw_description.startswith(
+            _ANSWER_CLOSE, start + 1,
+        ):
+            return letter.upper()
+        end = raw_description.find(_ANSWER_CLOSE, start)
+        if end != -1:
+            for ch in raw_description[start:end]:
+                if ch in "ABCabc":
+                    return ch.upper()
         # Tag existed but contained no A/B/C — fall through to fallback
 
     # --- LaTeX \boxed{} extraction ---
     # Handles: \boxed{A}, $\boxed{A}$, $$\boxed{A}$$, \boxed{ A }, etc.
-    boxed_match = re.search(
-        r'\\boxed\{\s*([ABCabc])\s*\}',
-        raw_description,
-    )
+    boxed_match = _BOXED_RE.search(raw_description)
     if boxed_match:
         return boxed_match.group(1).upper()
 
     # --- Markdown bold/emphasis: **A**, *A*, __A__ ---
-    bold_match = re.search(
-        r'(?:\*\*|__)\s*([ABCabc])\s*(?:\*\*|__)',
-        raw_description[-300:],
-    )
+    tail_300 = raw_description[-300:]
+    bold_match = _BOLD_RE.search(tail_300)
     if bold_match:
         return bold_match.group(1).upper()
 
     # --- "Answer: A" / "answer is A" / "my answer is A" patterns ---
-    explicit_match = re.search(
-        r'(?:answer|choice|option)\s*(?:is|:)\s*([ABCabc])',
-        raw_description[-300:],
-        re.IGNORECASE,
-    )
+    explicit_match = _EXPLICIT_RE.search(tail_300)
     if explicit_match:
         return explicit_match.group(1).upper()
 
     # --- Fallback: scan tail of response for standalone A/B/C ---
     # Only look at the last 150 chars to avoid matching A/B/C in reasoning text
-    tail = raw_description[-150:]
-    # Match "A.", "A)", "A:", "A\n", or standalone "A" at word boundary
-    fallback_match = re.search(
-        r'(?:^|\W)([ABC])(?:\.|\)|:|\s|$)',
-        tail,
-    )
+    fallback_match = _FALLBACK_RE.search(raw_description[-150:])
     if fallback_match:
         return fallback_match.group(1).upper()
 
@@ -399,46 +410,52 @@ class CausalGraphBridge:
 
             # A pair is relevant if they share at least one evidence chunk
             # OR if one variable is mentioned in any evidence chunk of the
-            # other variable.
-            candidate_pairs: set[tuple[str, str]] = set()
-            all_pairs = list(itertools.combinations(all_vars, 2))
-
-            for v1, v2 in all_pairs:
-                ev1 = var_to_evidence_ids.get(v1, set())
-                ev2 = var_to_evidence_ids.get(v2, set())
-                if ev1 & ev2:  # shared evidence chunks
-                    candidate_pairs.add((v1, v2))
-                    continue
-                # Check cross-mention: is v1 mentioned in v2's chunks or vice versa?
-                v1_lower = v1.replace("_", " ")
-                v2_lower = v2.replace("_", " ")
-                for eid in ev2:
+            # other variable.  ``combinations`` is iterated lazily and the
+            # per-variable lookups are hoisted out of the O(n²) loop.
+            no_evidence: frozenset[str] = frozenset()
+            evidence_of = {v: var_to_evidence_ids.get(v, no_evidence) for v in all_vars}
+            spaced = {v: v.replace("_", " ") for v in all_vars}
+
+            def _mentioned_in(var: str, eids: set[str]) -> bool:
+                var_lower = spaced[var]
+                for eid in eids:
                     text = evidence_text_cache.get(eid, "")
-                    if v1_lower in text or v1 in text:
-                        candidate_pairs.add((v1, v2))
-                        break
-                else:
-                    for eid in ev1:
-                        text = evidence_text_cache.get(eid, "")
-                        if v2_lower in text or v2 in text:
-                            candidate_pairs.add((v1, v2))
-                            break
-
-            return list(candidate_pairs)
+                    if var_lower in text or var in text:
+                        return True
+                return False
+
+            candidate_pairs: list[tuple[str, str]] = []
+            for v1, v2 in itertools.combinations(all_vars, 2):
+                ev1 = evidence_of[v1]
+                ev2 = evidence_of[v2]
+                if (
+                    not ev1.isdisjoint(ev2)  # shared evidence chunks
+                    # Cross-mention: is v1 mentioned in v2's chunks or vice versa?
+                    or _mentioned_in(v1, ev2)
+                    or _mentioned_in(v2, ev1)
+                ):
+                    candidate_pairs.append((v1, v2))
+
+            # Ordered de-dup (repeated variable names yield repeated pairs)
+            return list(dict.fromkeys(candidate_pairs))
 
         filtered_pairs = _prefilter_pairs(variables, evidence_bundles)
-        all_pair_count = len(list(itertools.combinations(variables, 2)))
+        all_pair_count = len(variables) * (len(variables) - 1) // 2
         _logger.info(
             "PyWhyLLM: evidence pre-filter reduced pairs from %d → %d (%.0f%% reduction)",
             all_pair_count, len(filtered_pairs),
             (1 - len(filtered_pairs) / max(all_pair_count, 1)) * 100,
         )
 
+        # Bound once per build: every worker records through this method.
+        _record_pair = (
+            _get_telemetry().record_pywhyllm_pair if _get_telemetry else None
+        )
+
         try:
             # Build the safe pairwise checker (same logic as before)
             def _safe_suggest_pairwise(var1: str, var2: str) -> tuple[str | None, str | None, str]:
                 """Thread-safe worker — performs ONE API call, returns a plain tuple."""
-                _tel = _get_telemetry() if _get_telemetry else None
                 _call_t0 = time.monotonic()
                 _parse_answer = ""  # track for telemetry
                 _was_normalized = False
@@ -479,7 +496,7 @@ class CausalGraphBridge:
                     # Detect if normalization actually recovered an answer that the
                     # old strict regex+join+equality approach would have missed.
                     if answer_str in ("A", "B", "C"):
-                        _old_tags = re.findall(r'<answer>(.*?)</answer>', _raw_desc)
+                        _old_tags = _STRICT_TAG_RE.findall(_raw_desc)
                         _old_joined = "".join(t.strip() for t in _old_tags)
                         if _old_joined != answer_str:
                             _was_normalized = True
@@ -503,8 +520,8 @@ class CausalGraphBridge:
                     raise
                 finally:
                     _call_latency = (time.monotonic() - _call_t0) * 1000
-                    if _tel:
-                        _tel.record_pywhyllm_pair(
+                    if _record_pair:
+                        _record_pair(
                             var1=var1, var2=var2,
                             answer=_parse_answer,
                             raw_description=_raw_desc[:500],
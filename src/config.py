@@ -1,5 +1,14 @@
-"""Configuration settings using pydantic-settings."""
+"""Configuration settings using pydantic-settings.
 
+Pydantic handles env/.env loading and validation; ``get_settings()`` and
+``get_verification_config()`` then return frozen ``__slots__`` snapshots
+(``ResolvedSettings`` / ``ResolvedVerificationConfig``) so hot-path
+attribute reads are plain slot loads instead of pydantic descriptor
+lookups.  A new setting must be declared in both places;
+``tests/test_config.py`` checks the field sets match.
+"""
+
+from dataclasses import dataclass
 from functools import lru_cache
 from typing import Optional
 
@@ -48,10 +57,33 @@ class Settings(BaseSettings):
     log_level: str = "INFO"
 
 
+@dataclass(slots=True, frozen=True)
+class ResolvedSettings:
+    """Immutable snapshot of ``Settings`` after env resolution."""
+
+    database_url: str
+    db_pool_size: int
+    db_max_overflow: int
+    redis_url: str
+    redis_ttl_seconds: int
+    minio_endpoint: str
+    minio_access_key: str
+    minio_secret_key: str
+    minio_bucket: str
+    minio_secure: bool
+    qdrant_host: str
+    qdrant_port: int
+    google_ai_api_key: Optional[str]
+    pageindex_api_key: Optional[str]
+    pageindex_url: str
+    debug: bool
+    log_level: str
+
+
 @lru_cache
-def get_settings() -> Settings:
-    """Get cached settings instance."""
-    return Settings()
+def get_settings() -> ResolvedSettings:
+    """Get cached settings snapshot."""
+    return ResolvedSettings(**Settings().model_dump())
 
 
 class VerificationConfig(BaseSettings):
@@ -101,6 +133,14 @@ class VerificationConfig(BaseSettings):
         default="gemini-2.5-flash",
         description="LLM model for verification judge (Flash for speed; set to gemini-2.5-pro for strict mode)",
     )
+    enable_two_tier_judge: bool = Field(
+        default=True,
+        description=(
+            "Judge grounding with gemini-2.5-flash first and escalate only "
+            "uncertain verdicts to judge_model.  No effect when judge_model "
+            "is already Flash."
+        ),
+    )
 
     # Concurrency & rate-limiting
     llm_semaphore_limit: int = Field(
@@ -130,7 +170,23 @@ class VerificationConfig(BaseSettings):
     )
 
 
+@dataclass(slots=True, frozen=True)
+class ResolvedVerificationConfig:
+    """Immutable snapshot of ``VerificationConfig`` after env resolution."""
+
+    max_judge_iterations: int
+    grounding_confidence_threshold: float
+    enable_adversarial_pass: bool
+    judge_model: str
+    enable_two_tier_judge: bool
+    llm_semaphore_limit: int
+    max_retries: int
+    backoff_base: float
+    backoff_jitter_max: float
+    retrieval_top_k: int
+
+
 @lru_cache
-def get_verification_config() -> VerificationConfig:
-    """Get cached verification config instance."""
-    return VerificationConfig()
+def get_verification_config() -> ResolvedVerificationConfig:
+    """Get cached verification config snapshot."""
+    return ResolvedVerificationConfig(**VerificationConfig().model_dump())
@@ -18,18 +18,32 @@ Data-quality fixes baked in:
 
 from __future__ import annotations
 
+import functools
 import logging
 import os
 import textwrap
 from dataclasses import dataclass, field
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
-import langextract as lx
 from pydantic import BaseModel, Field
 
 from src.config import get_settings
 from src.utils.text import canonicalize_var_id
 
+if TYPE_CHECKING:
+    import langextract as lx
+
+
+def _langextract() -> Any:
+    """Import ``langextract`` on first use.
+
+    Its package ``__init__`` eagerly pulls in the visualisation stack
+    (pandas, IPython), which is most of Mode 1's import time; code that
+    never extracts — e.g. the answer-parsing tests — skips that cost.
+    """
+    import langextract
+    return langextract
+
 _logger = logging.getLogger(__name__)
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -191,93 +205,96 @@ _VARIABLE_PROMPT = textwrap.dedent("""\
     variable.  Do NOT put reasoning into the ``description`` field —
     description should be a short factual definition only.""")
 
-_VARIABLE_EXAMPLES = [
-    lx.data.ExampleData(
-        text=(
-            "Higher staff training hours improved barista skill levels. "
-            "Seasonal foot traffic drives daily customer volume. "
-            "Specialty drink pricing is set above competitor averages."
-        ),
-        extractions=[
-            lx.data.Extraction(
-                extraction_class="variable",
-                extraction_text="staff training hours",
-                attributes={
-                    "type": "continuous",
-                    "measurement_status": "measured",
-                    "description": "Hours of barista training per quarter",
-                    "chain_of_thought": (
-                        "Mentioned as a direct input — 'training hours' — "
-                        "and it is measurable in hours."
-                    ),
-                },
-            ),
-            lx.data.Extraction(
-                extraction_class="variable",
-                extraction_text="barista skill levels",
-                attributes={
-                    "type": "continuous",
-                    "measurement_status": "observable",
-                    "description": "Assessed proficiency of barista staff",
-                    "chain_of_thought": (
-                        "Outcome of training; distinct from training hours "
-                        "because it measures proficiency, not duration."
-                    ),
-                },
+@functools.cache
+def _variable_examples() -> list[lx.data.ExampleData]:
+    lx = _langextract()
+    return [
+        lx.data.ExampleData(
+            text=(
+                "Higher staff training hours improved barista skill levels. "
+                "Seasonal foot traffic drives daily customer volume. "
+                "Specialty drink pricing is set above competitor averages."
             ),
-            lx.data.Extraction(
-                extraction_class="variable",
-                extraction_text="Seasonal foot traffic",
-                attributes={
-                    "type": "continuous",
-                    "measurement_status": "measured",
-                    "description": "Pedestrian volume influenced by season",
-                    "chain_of_thought": (
-                        "External demand driver; measurable via footfall "
-                        "counters."
-                    ),
-                },
-            ),
-            lx.data.Extraction(
-                extraction_class="variable",
-                extraction_text="daily customer volume",
-                attributes={
-                    "type": "continuous",
-                    "measurement_status": "measured",
-                    "description": "Number of customers visiting per day",
-                    "chain_of_thought": (
-                        "Downstream from foot traffic; measured at POS."
-                    ),
-                },
-            ),
-            lx.data.Extraction(
-                extraction_class="variable",
-                extraction_text="Specialty drink pricing",
-                attributes={
-                    "type": "continuous",
-                    "measurement_status": "measured",
-                    "description": "Price point for specialty beverages",
-                    "chain_of_thought": (
-                        "Controllable lever; distinct from competitor pricing."
-                    ),
-                },
-            ),
-            lx.data.Extraction(
-                extraction_class="variable",
-                extraction_text="competitor averages",
-                attributes={
-                    "type": "continuous",
-                    "measurement_status": "observable",
-                    "description": "Average competitor pricing in the area",
-                    "chain_of_thought": (
-                        "External benchmark; observable but not under our "
-                        "control."
-                    ),
-                },
-            ),
-        ],
-    )
-]
+            extractions=[
+                lx.data.Extraction(
+                    extraction_class="variable",
+                    extraction_text="staff training hours",
+                    attributes={
+                        "type": "continuous",
+                        "measurement_status": "measured",
+                        "description": "Hours of barista training per quarter",
+                        "chain_of_thought": (
+                            "Mentioned as a direct input — 'training hours' — "
+                            "and it is measurable in hours."
+                        ),
+                    },
+                ),
+                lx.data.Extraction(
+                    extraction_class="variable",
+                    extraction_text="barista skill levels",
+                    attributes={
+                        "type": "continuous",
+                        "measurement_status": "observable",
+                        "description": "Assessed proficiency of barista staff",
+                        "chain_of_thought": (
+                            "Outcome of training; distinct from training hours "
+                            "because it measures proficiency, not duration."
+                        ),
+                    },
+                ),
+                lx.data.Extraction(
+                    extraction_class="variable",
+                    extraction_text="Seasonal foot traffic",
+                    attributes={
+                        "type": "continuous",
+                        "measurement_status": "measured",
+                        "description": "Pedestrian volume influenced by season",
+                        "chain_of_thought": (
+                            "External demand driver; measurable via footfall "
+                            "counters."
+                        ),
+                    },
+                ),
+                lx.data.Extraction(
+                    extraction_class="variable",
+                    extraction_text="daily customer volume",
+                    attributes={
+                        "type": "continuous",
+                        "measurement_status": "measured",
+                        "description": "Number of customers visiting per day",
+                        "chain_of_thought": (
+                            "Downstream from foot traffic; measured at POS."
+                        ),
+                    },
+                ),
+                lx.data.Extraction(
+                    extraction_class="variable",
+                    extraction_text="Specialty drink pricing",
+                    attributes={
+                        "type": "continuous",
+                        "measurement_status": "measured",
+                        "description": "Price point for specialty beverages",
+                        "chain_of_thought": (
+                            "Controllable lever; distinct from competitor pricing."
+                        ),
+                    },
+                ),
+                lx.data.Extraction(
+                    extraction_class="variable",
+                    extraction_text="competitor averages",
+                    attributes={
+                        "type": "continuous",
+                        "measurement_status": "observable",
+                        "description": "Average competitor pricing in the area",
+                        "chain_of_thought": (
+                            "External benchmark; observable but not under our "
+                            "control."
+                        ),
+                    },
+                ),
+            ],
+        )
+    ]
 
 _EDGE_PROMPT_TEMPLATE = textwrap.dedent("""\
     Extract every causal relationship between variables found in
@@ -308,23 +325,26 @@ _QUERY_PROMPT = textwrap.dedent("""\
     target outcome to optimise, and any constraints mentioned.
     Use exact phrases from the text.""")
 
-_QUERY_EXAMPLES = [
-    lx.data.ExampleData(
-        text="Should we increase prices to boost revenue while staying within budget?",
-        extractions=[
-            lx.data.Extraction(
-                extraction_class="decision_query",
-                extraction_text="increase prices to boost revenue",
-                attributes={
-                    "domain": "pricing",
-                    "intervention": "increase prices",
-                    "target_outcome": "revenue",
-                    "constraints": "staying within budget",
-                },
-            ),
-        ],
-    ),
-]
+@functools.cache
+def _query_examples() -> list[lx.data.ExampleData]:
+    lx = _langextract()
+    return [
+        lx.data.ExampleData(
+            text="Should we increase prices to boost revenue while staying within budget?",
+            extractions=[
+                lx.data.Extraction(
+                    extraction_class="decision_query",
+                    extraction_text="increase prices to boost revenue",
+                    attributes={
+                        "domain": "pricing",
+                        "intervention": "increase prices",
+                        "target_outcome": "revenue",
+                        "constraints": "staying within budget",
+                    },
+                ),
+            ],
+        ),
+    ]
 
 _RECOMMENDATION_PROMPT = textwrap.dedent("""\
     Extract recommendation claims from the causal analysis and evidence.
@@ -338,33 +358,36 @@ _RECOMMENDATION_PROMPT = textwrap.dedent("""\
     Attributes must include the recommendation, confidence level,
     reasoning, suggested actions, and risks.""")
 
-_RECOMMENDATION_EXAMPLES = [
-    lx.data.ExampleData(
-        text=(
-            "Analysis shows price increases reduce demand through elasticity. "
-            "Revenue impact is positive when demand drop is below 15%. "
-            "Risk: competitor under-cutting may negate gains."
-        ),
-        extractions=[
-            lx.data.Extraction(
-                extraction_class="recommendation_claim",
-                extraction_text="price increases reduce demand through elasticity",
-                attributes={
-                    "recommendation": "Implement moderate price increase of 5-10%",
-                    "confidence": "medium",
-                    "reasoning": "Elasticity effect is present but manageable",
-                    "actions": "Raise prices gradually, monitor demand weekly",
-                    "risks": "Competitor under-cutting may negate gains",
-                    "chain_of_thought": (
-                        "The evidence states demand only drops significantly "
-                        "above 15% — a 5-10% hike stays under that threshold, "
-                        "so net revenue should rise."
-                    ),
-                },
+@functools.cache
+def _recommendation_examples() -> list[lx.data.ExampleData]:
+    lx = _langextract()
+    return [
+        lx.data.ExampleData(
+            text=(
+                "Analysis shows price increases reduce demand through elasticity. "
+                "Revenue impact is positive when demand drop is below 15%. "
+                "Risk: competitor under-cutting may negate gains."
             ),
-        ],
-    ),
-]
+            extractions=[
+                lx.data.Extraction(
+                    extraction_class="recommendation_claim",
+                    extraction_text="price increases reduce demand through elasticity",
+                    attributes={
+                        "recommendation": "Implement moderate price increase of 5-10%",
+                        "confidence": "medium",
+                        "reasoning": "Elasticity effect is present but manageable",
+                        "actions": "Raise prices gradually, monitor demand weekly",
+                        "risks": "Competitor under-cutting may negate gains",
+                        "chain_of_thought": (
+                            "The evidence states demand only drops significantly "
+                            "above 15% — a 5-10% hike stays under that threshold, "
+                            "so net revenue should rise."
+                        ),
+                    },
+                ),
+            ],
+        ),
+    ]
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -406,7 +429,7 @@ class ExtractionService:
         examples: list[lx.data.ExampleData],
     ) -> lx.data.ExtractionResult:
         """Single choke-point for every ``lx.extract`` call."""
-        return lx.extract(
+        return _langextract().extract(
             text_or_documents=text,
             prompt_description=prompt,
             examples=examples,
@@ -504,7 +527,7 @@ class ExtractionService:
             Deduplicated, citation-validated variable list.
         """
         prompt = f"Domain: {domain}. " + _VARIABLE_PROMPT
-        result = self._call_lx(evidence_text, prompt, _VARIABLE_EXAMPLES)
+        result = self._call_lx(evidence_text, prompt, _variable_examples())
 
         variables: list[ExtractedVariable] = []
         seen_names: set[str] = set()
@@ -671,7 +694,7 @@ class ExtractionService:
                 f"Pick the single best match for the user's query."
             )
 
-        result = self._call_lx(query, prompt, _QUERY_EXAMPLES)
+        result = self._call_lx(query, prompt, _query_examples())
 
         for ext in result.extractions or []:
             if ext.extraction_class == "decision_query":
@@ -718,7 +741,7 @@ class ExtractionService:
         ExtractedRecommendation
         """
         result = self._call_lx(
-            context_text, _RECOMMENDATION_PROMPT, _RECOMMENDATION_EXAMPLES,
+            context_text, _RECOMMENDATION_PROMPT, _recommendation_examples(),
         )
 
         for ext in result.extractions or []:
@@ -781,6 +804,7 @@ class ExtractionService:
 
         Falls back to a minimal generic example if fewer than 2 variables.
         """
+        lx = _langextract()
         if len(variable_ids) < 2:
             return [
                 lx.data.ExampleData(
@@ -30,6 +30,15 @@ class LocationMetadata(BaseModel):
     start_char: Optional[int] = Field(default=None, ge=0, description="Start character offset")
     end_char: Optional[int] = Field(default=None, ge=0, description="End character offset")
 
+    @property
+    def display(self) -> str:
+        """Short citation label, e.g. ``"p.5, Churn Analysis"``."""
+        if self.page_number and self.section_name:
+            return f"p.{self.page_number}, {self.section_name}"
+        if self.page_number:
+            return f"p.{self.page_number}"
+        return self.section_name or "unknown location"
+
 
 class RetrievalTrace(BaseModel):
     """Provenance information for how evidence was retrieved."""
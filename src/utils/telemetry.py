@@ -20,38 +20,232 @@ Usage::
 
 from __future__ import annotations
 
-import json
 import logging
 import os
+import threading
 import time
-from dataclasses import dataclass, field, asdict
-from datetime import datetime, timezone
-from pathlib import Path
+from collections import Counter, deque
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from itertools import islice
+from queue import Empty, SimpleQueue
 from threading import Lock
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Final, NamedTuple, Union
+
+import orjson
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+# Cold-path imports (pathlib, datetime) are deferred
+# to summary()/dump() to keep this eagerly-imported module lean.
 
 _logger = logging.getLogger(__name__)
 
+# Memory bounds — every per-run collection is a ring buffer so a long
+# pipeline run keeps O(1) telemetry state.
+_MAX_EVENTS = int(os.environ.get("CAUSEWAY_TELEMETRY_MAX_EVENTS", "50000"))
+_LATENCY_WINDOW = 1024     # recent samples kept (per thread) for percentiles
+_MAX_RAW_OUTPUTS = 200
+_MAX_REJECTION_REASONS = 500
+
+_DRAIN_BATCH = 256         # max queued events ingested per drainer wake-up
+_FLUSH_TIMEOUT_S = 5.0
+
+_DUMP_BUFFER_BYTES = 1 << 20  # dump() write buffer: one syscall per MiB, not per 8 KiB
+_DUMP_OPTIONS = (
+    orjson.OPT_INDENT_2
+    | orjson.OPT_SERIALIZE_DATACLASS
+    | orjson.OPT_NAIVE_UTC
+)
+
+
+# Fixed body of print_summary(); keys are ``PipelineTelemetry.summary_flat()``.
+_SUMMARY_TEMPLATE: Final = """
+── Variables ──
+  Raw discovered:          %(variables.raw_discovered)s
+  After canonicalization:  %(variables.after_canonicalization)s
+  Added to engine:         %(variables.added_to_engine)s
+
+── LLM Calls ──
+  Total calls:     %(llm_calls.total)s
+  By model:        %(llm_calls.by_model)s
+  Avg latency:     %(llm_calls.avg_latency_ms).0fms
+  p50/p95/p99:     %(llm_calls.p50_latency_ms).0f / %(llm_calls.p95_latency_ms).0f / %(llm_calls.p99_latency_ms).0fms
+  Retries:         %(llm_calls.retries)s
+  Errors:          %(llm_calls.errors)s
+  Quota errors:    %(llm_calls.quota_errors)s
+  Fallbacks:       %(llm_calls.fallbacks_to_prompt_injection)s
+  Cache hits:      %(llm_calls.cache_hits)s (semantic: %(llm_calls.semantic_cache_hits)s)
+
+── PyWhyLLM Pairwise ──
+  Total pairs:     %(pywhyllm_pairwise.total_pairs)s
+  A (var1→var2):   %(pywhyllm_pairwise.edges_found_A)s
+  B (var2→var1):   %(pywhyllm_pairwise.edges_found_B)s
+  C (no relation): %(pywhyllm_pairwise.no_relationship_C)s
+  Parse failures:  %(pywhyllm_pairwise.parse_failures)s
+  Exceptions:      %(pywhyllm_pairwise.exceptions)s
+  Avg latency:     %(pywhyllm_pairwise.avg_latency_ms).0fms
+  p50/p95/p99:     %(pywhyllm_pairwise.p50_latency_ms).0f / %(pywhyllm_pairwise.p95_latency_ms).0f / %(pywhyllm_pairwise.p99_latency_ms).0fms
+
+── Edge Dropout Cascade ──
+  PyWhyLLM proposed:           %(edge_dropout.pywhyllm_proposed)s
+  LangExtract proposed:        %(edge_dropout.langextract_proposed)s
+  After dedup:                 %(edge_dropout.total_after_dedup)s
+  Submitted to verification:   %(edge_dropout.submitted_to_verification)s
+  Grounded by verification:    %(edge_dropout.grounded_by_verification)s
+  Rejected by verification:    %(edge_dropout.rejected_by_verification)s
+  NodeNotFound errors:         %(edge_dropout.node_not_found_errors)s
+  CycleDetected errors:        %(edge_dropout.cycle_detected_errors)s
+  Other add errors:            %(edge_dropout.other_add_errors)s
+  Final edges in graph:        %(edge_dropout.final_edges_in_graph)s
+
+── Verification ──
+  Judge calls:             %(verification.judge_calls)s
+  Adversarial calls:       %(verification.adversarial_calls)s (gated: %(verification.adversarial_skipped)s)
+  Grounded:                %(verification.grounded)s
+  Rejected:                %(verification.rejected)s
+  No evidence:             %(verification.no_evidence_retrievals)s
+  Exhausted iterations:    %(verification.exhausted_iterations)s
+  Avg verdict confidence:  %(verification.avg_verdict_confidence).3f
+
+── Var ID Resolve Misses ──"""
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 #  Event record
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-@dataclass
-class TelemetryEvent:
-    """Single telemetry data-point."""
+class TelemetryEvent(NamedTuple):
+    """Single telemetry data-point.
+
+    A NamedTuple rather than a dataclass: events are the most numerous
+    telemetry objects, and a tuple has no per-instance ``__dict__``.
+    ``data_json`` holds the event payload already serialised by orjson,
+    so the dump can splice it into the output without re-encoding.  The
+    ISO-8601 wall clock is derived from ``timestamp`` at dump time.
+    """
     stage: str
     event: str
-    timestamp: float          # time.monotonic() for latency math
-    wall_clock: str           # ISO-8601 for human readability
-    data: dict[str, Any] = field(default_factory=dict)
+    timestamp: int            # time.monotonic_ns() for latency math
+    data_json: bytes = b"{}"
+
+
+def _serialise(data: dict[str, Any]) -> bytes:
+    try:
+        return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS, default=str)
+    except (TypeError, orjson.JSONEncodeError) as exc:
+        return orjson.dumps({"serialization_error": str(exc)})
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  Per-thread sample buffers
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+class _ThreadLocalSamples:
+    """Recent float samples, buffered per thread.
+
+    Each worker thread appends to its own ring buffer without taking a
+    lock; the registration lock is only held the first time a thread
+    appends.  Readers concatenate every thread's buffer.  Only the most
+    recent ``maxlen`` samples per thread are retained — running totals
+    live on the owning counter.
+    """
+
+    __slots__ = ("_local", "_buffers", "_register_lock", "_maxlen")
+
+    def __init__(self, maxlen: int = _LATENCY_WINDOW) -> None:
+        self._local = threading.local()
+        self._buffers: list[deque[float]] = []
+        self._register_lock = Lock()
+        self._maxlen = maxlen
+
+    def append(self, value: float) -> None:
+        try:
+            buf = self._local.buf
+        except AttributeError:
+            buf = self._local.buf = deque(maxlen=self._maxlen)
+            with self._register_lock:
+                self._buffers.append(buf)
+        buf.append(value)
+
+    def values(self) -> list[float]:
+        """Concatenate the samples recorded by every thread."""
+        with self._register_lock:
+            buffers = list(self._buffers)
+        return [v for buf in buffers for v in buf]
+
+    def percentiles(self, qs: tuple[float, ...] = (50, 95, 99)) -> list[float]:
+        """Percentiles of the retained window (linear interpolation).
+
+        One C-level ``sorted()`` pass over at most ``maxlen`` samples per
+        thread; returns zeros when no samples have been recorded.
+        """
+        ordered = sorted(self.values())
+        if not ordered:
+            return [0.0] * len(qs)
+        last = len(ordered) - 1
+        out: list[float] = []
+        for q in qs:
+            pos = last * q / 100
+            lo = int(pos)
+            hi = min(lo + 1, last)
+            out.append(ordered[lo] + (ordered[hi] - ordered[lo]) * (pos - lo))
+        return out
+
+    def __len__(self) -> int:
+        with self._register_lock:
+            return sum(len(buf) for buf in self._buffers)
+
+    def __repr__(self) -> str:
+        return f"_ThreadLocalSamples(n={len(self)})"
+
+
+class _ColumnRing:
+    """Bounded record log stored column-wise.
+
+    Rows share a fixed set of keys, so each key gets its own ring buffer
+    instead of every row paying for a dict.  Rows are only materialised
+    as dicts by ``rows()`` / iteration, i.e. at summary or dump time.
+    Callers serialise appends (their subsystem lock), which keeps the
+    columns aligned.
+    """
+
+    __slots__ = ("_keys", "_columns")
+
+    def __init__(self, keys: tuple[str, ...], maxlen: int) -> None:
+        self._keys = keys
+        self._columns: tuple[deque[Any], ...] = tuple(
+            deque(maxlen=maxlen) for _ in keys
+        )
+
+    def append(self, *values: Any) -> None:
+        for column, value in zip(self._columns, values, strict=True):
+            column.append(value)
+
+    def rows(self, limit: int | None = None) -> list[dict[str, Any]]:
+        """Materialise the oldest ``limit`` (default: all) rows as dicts."""
+        keys = self._keys
+        rows = zip(*self._columns)
+        if limit is not None:
+            rows = islice(rows, limit)
+        return [dict(zip(keys, row)) for row in rows]
+
+    def __iter__(self) -> Iterator[dict[str, Any]]:
+        return iter(self.rows())
+
+    def __len__(self) -> int:
+        return len(self._columns[0])
+
+    def __repr__(self) -> str:
+        return f"_ColumnRing(keys={self._keys}, n={len(self)})"
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 #  Counters
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-@dataclass
+@dataclass(slots=True)
 class LLMCallCounter:
     """Accumulated stats for LLM calls."""
     total_calls: int = 0
@@ -62,11 +256,15 @@ class LLMCallCounter:
     total_errors: int = 0
     total_quota_errors: int = 0
     total_fallbacks: int = 0           # native → prompt-injection
-    calls_by_model: dict[str, int] = field(default_factory=dict)
-    latency_samples_ms: list[float] = field(default_factory=list)
+    cache_hits: int = 0                # judge verdicts served from cache
+    semantic_cache_hits: int = 0       # … matched by embedding similarity
+    calls_by_model: Counter[str] = field(default_factory=Counter)
+    latency_sum_ms: float = 0.0
+    latency_count: int = 0
+    latency_samples_ms: _ThreadLocalSamples = field(default_factory=_ThreadLocalSamples)
 
 
-@dataclass
+@dataclass(slots=True)
 class PyWhyLLMCounter:
     """Stats specifically for the O(n²) pairwise stage."""
     total_pairs: int = 0
@@ -76,11 +274,18 @@ class PyWhyLLMCounter:
     pairs_normalized: int = 0  # answers recovered via _normalize_answer (were not exact A/B/C before normalization)
     pairs_parse_fail: int = 0
     pairs_exception: int = 0
-    raw_outputs: list[dict[str, Any]] = field(default_factory=list)
-    per_call_latency_ms: list[float] = field(default_factory=list)
-
-
-@dataclass
+    raw_outputs: _ColumnRing = field(
+        default_factory=lambda: _ColumnRing(
+            ("var1", "var2", "answer_parsed", "raw_description", "latency_ms", "error"),
+            _MAX_RAW_OUTPUTS,
+        ),
+    )
+    latency_sum_ms: float = 0.0
+    latency_count: int = 0
+    per_call_latency_ms: _ThreadLocalSamples = field(default_factory=_ThreadLocalSamples)
+
+
+@dataclass(slots=True)
 class VerificationCounter:
     """Stats for the verification loop."""
     total_edges_submitted: int = 0
@@ -92,11 +297,20 @@ class VerificationCounter:
     exhausted_iterations_count: int = 0
     duplicate_query_breaks: int = 0
     adversarial_rejections: int = 0
-    rejection_reasons: list[dict[str, str]] = field(default_factory=list)
-    verdict_confidences: list[float] = field(default_factory=list)
-
-
-@dataclass
+    adversarial_skipped: int = 0       # gated before the LLM call
+    evidence_truncated: int = 0        # evidence blocks trimmed to the prompt cap
+    escalations: int = 0               # fast-model verdicts re-judged by the strong model
+    empty_evidence_skipped: int = 0    # judge calls answered without an LLM round-trip
+    rejection_reasons: _ColumnRing = field(
+        default_factory=lambda: _ColumnRing(
+            ("edge", "reason", "iterations"), _MAX_REJECTION_REASONS,
+        ),
+    )
+    conf_sum: float = 0.0
+    conf_count: int = 0
+
+
+@dataclass(slots=True)
 class EdgeDropoutTracker:
     """Tracks where edges are lost across stages."""
     pywhyllm_proposed: int = 0
@@ -119,17 +333,60 @@ class EdgeDropoutTracker:
 class PipelineTelemetry:
     """Lightweight in-process telemetry for the Mode 1 pipeline."""
 
+    # Parsed pairwise answer → PyWhyLLMCounter field; anything else is
+    # counted as a parse failure.
+    _ANSWER_BUCKETS: Final[dict[str, str]] = {
+        "A": "pairs_a", "B": "pairs_b", "C": "pairs_c",
+    }
+
     def __init__(self) -> None:
+        # ``_lock`` is only taken by reset().  Counters are striped by
+        # subsystem so that, e.g., an LLM call record never waits on a
+        # verification verdict; each lock is held only for the increment
+        # itself.  Float samples go to per-thread buffers and events are
+        # enqueued lock-free (see record()).
         self._lock = Lock()
+        self._llm_lock = Lock()
+        self._pywhy_lock = Lock()
+        self._verif_lock = Lock()
+        self._vars_lock = Lock()
+        # record() only serialises and enqueues; a daemon thread moves the
+        # events into the run's deque in batches, so appends never contend
+        # with readers or reset().
+        self._event_q: SimpleQueue[Union[TelemetryEvent, threading.Event]] = SimpleQueue()
+        self._drainer = threading.Thread(
+            target=self._drain_loop, name="telemetry-drainer", daemon=True,
+        )
+        self._drainer.start()
         self.reset()
 
     def reset(self) -> None:
-        """Clear all counters and events for a fresh run."""
-        with self._lock:
-            self.run_start: float = time.monotonic()
-            self.run_start_wall: str = datetime.now(timezone.utc).isoformat()
-            self.events: list[TelemetryEvent] = []
-            self.stage_starts: dict[str, float] = {}
+        """Clear all counters and events for a fresh run.
+
+        Events recorded while the reset is in progress are timestamped
+        before the new ``run_start_ns``; the drainer drops them rather
+        than letting them land in the new run.
+        """
+        # Outside the locks: flush() may wait up to _FLUSH_TIMEOUT_S and
+        # must not stall record_*() callers meanwhile.
+        self.flush()
+        # Every stripe is taken, always in this order, so no record_*()
+        # call can observe a half-reset state.
+        with (
+            self._lock, self._llm_lock, self._pywhy_lock,
+            self._verif_lock, self._vars_lock,
+        ):
+            # Monotonic clocks are kept as integer nanoseconds; conversion
+            # to seconds happens only when a duration is reported.  The
+            # drainer reads (start, events) from this one tuple, so it can
+            # never pair the new start with the old deque or vice versa.
+            self._run: tuple[int, deque[TelemetryEvent]] = (
+                time.monotonic_ns(), deque(maxlen=_MAX_EVENTS),
+            )
+            self.run_start_ns: int = self._run[0]
+            self._run_start_epoch: float = time.time()
+            self._run_start_dt: datetime | None = None   # built on first use
+            self.stage_starts: dict[str, int] = {}
             self.stage_durations: dict[str, float] = {}
             self.llm = LLMCallCounter()
             self.pywhyllm = PyWhyLLMCounter()
@@ -144,36 +401,93 @@ class PipelineTelemetry:
     # ── Stage timing ──────────────────────────────────────────────────
 
     def stage_start(self, stage: str) -> None:
-        with self._lock:
-            self.stage_starts[stage] = time.monotonic()
+        self.stage_starts[stage] = time.monotonic_ns()
         self.record(stage, "stage_start", {})
 
     def stage_end(self, stage: str, extra: dict[str, Any] | None = None) -> None:
-        with self._lock:
-            t0 = self.stage_starts.get(stage)
-            elapsed = (time.monotonic() - t0) if t0 else 0.0
-            self.stage_durations[stage] = elapsed
+        t0 = self.stage_starts.get(stage)
+        elapsed = (time.monotonic_ns() - t0) / 1e9 if t0 is not None else 0.0
+        self.stage_durations[stage] = elapsed
         payload = {"elapsed_seconds": round(elapsed, 3)}
         if extra:
             payload.update(extra)
         self.record(stage, "stage_end", payload)
         _logger.info(
             "[TELEMETRY] Stage '%s' completed in %.2fs | %s",
-            stage, elapsed, json.dumps(extra or {}, default=str)[:300],
+            stage, elapsed,
+            orjson.dumps(
+                extra or {}, option=orjson.OPT_NON_STR_KEYS, default=str,
+            )[:300].decode(errors="replace"),
         )
 
     # ── Generic event recorder ────────────────────────────────────────
 
     def record(self, stage: str, event: str, data: dict[str, Any]) -> None:
-        ev = TelemetryEvent(
-            stage=stage,
-            event=event,
-            timestamp=time.monotonic(),
-            wall_clock=datetime.now(timezone.utc).isoformat(),
-            data=data,
+        """Serialise ``data`` now and queue the event for the drainer.
+
+        Serialising here means later changes to ``data`` by the caller
+        cannot alter the recorded event.
+        """
+        event_obj = TelemetryEvent(stage, event, time.monotonic_ns(), _serialise(data))
+        # No lock: ``SimpleQueue.put_nowait`` is atomic and never blocks.
+        self._event_q.put_nowait(event_obj)
+
+    @property
+    def events(self) -> deque[TelemetryEvent]:
+        """All recorded events, after waiting for queued ones to land."""
+        self.flush()
+        return self._run[1]
+
+    def flush(self) -> bool:
+        """Block until every event recorded so far has been ingested.
+
+        Returns ``False`` (and logs a warning) if the drainer did not
+        reach this point within ``_FLUSH_TIMEOUT_S``.
+        """
+        if threading.current_thread() is self._drainer:
+            return True
+        if not self._drainer.is_alive():
+            # e.g. in a forked child — ingest inline instead.
+            self._ingest(self._take_queued())
+            return True
+        barrier = threading.Event()
+        self._event_q.put_nowait(barrier)
+        if barrier.wait(_FLUSH_TIMEOUT_S):
+            return True
+        _logger.warning(
+            "Telemetry flush timed out after %.1fs with ~%d events still queued; "
+            "events and dumps may be incomplete",
+            _FLUSH_TIMEOUT_S, self._event_q.qsize(),
         )
-        with self._lock:
-            self.events.append(ev)
+        return False
+
+    def _drain_loop(self) -> None:
+        q = self._event_q
+        while True:
+            batch = [q.get()]
+            batch.extend(self._take_queued(_DRAIN_BATCH - 1))
+            self._ingest(batch)
+
+    def _take_queued(
+        self, limit: int | None = None,
+    ) -> list[Union[TelemetryEvent, threading.Event]]:
+        items: list[Union[TelemetryEvent, threading.Event]] = []
+        while limit is None or len(items) < limit:
+            try:
+                items.append(self._event_q.get_nowait())
+            except Empty:
+                break
+        return items
+
+    def _ingest(self, batch: list[Union[TelemetryEvent, threading.Event]]) -> None:
+        for item in batch:
+            if isinstance(item, threading.Event):
+                item.set()      # flush barrier: everything before it is in
+                continue
+            run_start_ns, events = self._run
+            if item.timestamp < run_start_ns:
+                continue        # recorded before a reset(): not this run's
+            events.append(item)
 
     # ── LLM call tracking ────────────────────────────────────────────
 
@@ -186,13 +500,15 @@ class PipelineTelemetry:
         prompt_tokens: int = 0,
         completion_tokens: int = 0,
     ) -> None:
-        with self._lock:
+        self.llm.latency_samples_ms.append(latency_ms)
+        with self._llm_lock:
             self.llm.total_calls += 1
+            self.llm.latency_sum_ms += latency_ms
+            self.llm.latency_count += 1
             self.llm.total_prompt_chars += prompt_chars
             self.llm.total_completion_chars += completion_chars
             self.llm.total_prompt_tokens_est += prompt_chars // 4
-            self.llm.latency_samples_ms.append(latency_ms)
-            self.llm.calls_by_model[model] = self.llm.calls_by_model.get(model, 0) + 1
+            self.llm.calls_by_model[model] += 1
             if prompt_tokens:
                 self.llm.total_prompt_tokens_est = max(
                     self.llm.total_prompt_tokens_est,
@@ -200,14 +516,14 @@ class PipelineTelemetry:
                 )
 
     def record_llm_retry(self, model: str, attempt: int, error: str) -> None:
-        with self._lock:
+        with self._llm_lock:
             self.llm.total_retries += 1
         self.record("llm", "retry", {
             "model": model, "attempt": attempt, "error": error[:300],
         })
 
     def record_llm_error(self, model: str, error: str, is_quota: bool = False) -> None:
-        with self._lock:
+        with self._llm_lock:
             self.llm.total_errors += 1
             if is_quota:
                 self.llm.total_quota_errors += 1
@@ -216,7 +532,7 @@ class PipelineTelemetry:
         })
 
     def record_llm_fallback(self, model: str) -> None:
-        with self._lock:
+        with self._llm_lock:
             self.llm.total_fallbacks += 1
         self.record("llm", "native_to_prompt_fallback", {"model": model})
 
@@ -233,31 +549,26 @@ class PipelineTelemetry:
         *,
         was_normalized: bool = False,
     ) -> None:
-        with self._lock:
-            self.pywhyllm.total_pairs += 1
-            self.pywhyllm.per_call_latency_ms.append(latency_ms)
-            if error:
-                self.pywhyllm.pairs_exception += 1
-            elif answer == "A":
-                self.pywhyllm.pairs_a += 1
-            elif answer == "B":
-                self.pywhyllm.pairs_b += 1
-            elif answer == "C":
-                self.pywhyllm.pairs_c += 1
-            else:
-                self.pywhyllm.pairs_parse_fail += 1
+        self.pywhyllm.per_call_latency_ms.append(latency_ms)
+        # Everything that does not touch shared state is computed before
+        # taking the lock, keeping the critical section to the updates.
+        bucket = (
+            "pairs_exception" if error
+            else self._ANSWER_BUCKETS.get(answer, "pairs_parse_fail")
+        )
+        raw = raw_description[:500] if raw_description else ""
+        latency_rounded = round(latency_ms, 1)
+        with self._pywhy_lock:
+            pw = self.pywhyllm   # read under the lock: reset() swaps it
+            pw.total_pairs += 1
+            pw.latency_sum_ms += latency_ms
+            pw.latency_count += 1
+            setattr(pw, bucket, getattr(pw, bucket) + 1)
             if was_normalized:
-                self.pywhyllm.pairs_normalized += 1
-            # Store raw output for forensic analysis (limit to 200 samples)
-            if len(self.pywhyllm.raw_outputs) < 200:
-                self.pywhyllm.raw_outputs.append({
-                    "var1": var1,
-                    "var2": var2,
-                    "answer_parsed": answer,
-                    "raw_description": raw_description[:500] if raw_description else "",
-                    "latency_ms": round(latency_ms, 1),
-                    "error": error,
-                })
+                pw.pairs_normalized += 1
+            # Store raw output for forensic analysis (ring buffer of the
+            # most recent samples)
+            pw.raw_outputs.append(var1, var2, answer, raw, latency_rounded, error)
 
     # ── Verification tracking ────────────────────────────────────────
 
@@ -273,9 +584,10 @@ class PipelineTelemetry:
         evidence_chunk_count: int,
         evidence_block_chars: int,
     ) -> None:
-        with self._lock:
+        with self._verif_lock:
             self.verification.total_judge_calls += 1
-            self.verification.verdict_confidences.append(confidence)
+            self.verification.conf_sum += confidence
+            self.verification.conf_count += 1
         self.record("verification", "judge_verdict", {
             "edge": f"{from_var}->{to_var}",
             "iteration": iteration,
@@ -295,16 +607,16 @@ class PipelineTelemetry:
         rejection_reason: str | None,
         iterations_used: int,
     ) -> None:
-        with self._lock:
+        with self._verif_lock:
             if grounded:
                 self.verification.grounded_count += 1
             else:
                 self.verification.rejected_count += 1
-                self.verification.rejection_reasons.append({
-                    "edge": f"{from_var}->{to_var}",
-                    "reason": rejection_reason or "unknown",
-                    "iterations": iterations_used,
-                })
+                self.verification.rejection_reasons.append(
+                    f"{from_var}->{to_var}",
+                    rejection_reason or "unknown",
+                    iterations_used,
+                )
 
     def record_var_id_resolve_miss(
         self,
@@ -312,7 +624,7 @@ class PipelineTelemetry:
         resolved_id: str,
         match_type: str,
     ) -> None:
-        with self._lock:
+        with self._vars_lock:
             self.var_id_resolve_misses.append({
                 "raw_id": raw_id,
                 "resolved_id": resolved_id,
@@ -321,17 +633,28 @@ class PipelineTelemetry:
 
     # ── Dump to file ─────────────────────────────────────────────────
 
+    @property
+    def run_start_wall(self) -> str:
+        """ISO-8601 UTC wall clock of the last reset()."""
+        return self._run_start_datetime().isoformat()
+
+    def _run_start_datetime(self) -> datetime:
+        """UTC datetime of the last reset(), built once per run."""
+        if self._run_start_dt is None:
+            from datetime import datetime, timezone
+            self._run_start_dt = datetime.fromtimestamp(
+                self._run_start_epoch, tz=timezone.utc,
+            )
+        return self._run_start_dt
+
     def summary(self) -> dict[str, Any]:
         """Return a serialisable summary of the entire run."""
-        total_run_time = time.monotonic() - self.run_start
-        avg_pywhyllm = (
-            sum(self.pywhyllm.per_call_latency_ms)
-            / max(len(self.pywhyllm.per_call_latency_ms), 1)
-        )
-        avg_llm = (
-            sum(self.llm.latency_samples_ms)
-            / max(len(self.llm.latency_samples_ms), 1)
-        )
+        total_run_time = (time.monotonic_ns() - self.run_start_ns) / 1e9
+        avg_pywhyllm = self.pywhyllm.latency_sum_ms / max(self.pywhyllm.latency_count, 1)
+        avg_llm = self.llm.latency_sum_ms / max(self.llm.latency_count, 1)
+        avg_confidence = self.verification.conf_sum / max(self.verification.conf_count, 1)
+        llm_p50, llm_p95, llm_p99 = self.llm.latency_samples_ms.percentiles()
+        pw_p50, pw_p95, pw_p99 = self.pywhyllm.per_call_latency_ms.percentiles()
         return {
             "run_start_utc": self.run_start_wall,
             "total_run_seconds": round(total_run_time, 2),
@@ -345,15 +668,20 @@ class PipelineTelemetry:
             },
             "llm_calls": {
                 "total": self.llm.total_calls,
-                "by_model": self.llm.calls_by_model,
+                "by_model": dict(self.llm.calls_by_model),
                 "total_prompt_chars": self.llm.total_prompt_chars,
                 "total_completion_chars": self.llm.total_completion_chars,
                 "est_total_prompt_tokens": self.llm.total_prompt_tokens_est,
                 "avg_latency_ms": round(avg_llm, 1),
+                "p50_latency_ms": round(llm_p50, 1),
+                "p95_latency_ms": round(llm_p95, 1),
+                "p99_latency_ms": round(llm_p99, 1),
                 "retries": self.llm.total_retries,
                 "errors": self.llm.total_errors,
                 "quota_errors": self.llm.total_quota_errors,
                 "fallbacks_to_prompt_injection": self.llm.total_fallbacks,
+                "cache_hits": self.llm.cache_hits,
+                "semantic_cache_hits": self.llm.semantic_cache_hits,
             },
             "pywhyllm_pairwise": {
                 "total_pairs": self.pywhyllm.total_pairs,
@@ -365,8 +693,15 @@ class PipelineTelemetry:
                 "parse_failures": self.pywhyllm.pairs_parse_fail,
                 "exceptions": self.pywhyllm.pairs_exception,
                 "avg_latency_ms": round(avg_pywhyllm, 1),
+                "p50_latency_ms": round(pw_p50, 1),
+                "p95_latency_ms": round(pw_p95, 1),
+                "p99_latency_ms": round(pw_p99, 1),
+            },
+            # Flat int fields: a slot read per field, no asdict() deep copy.
+            "edge_dropout": {
+                name: getattr(self.edge_dropout, name)
+                for name in EdgeDropoutTracker.__slots__
             },
-            "edge_dropout": asdict(self.edge_dropout),
             "verification": {
                 "edges_submitted": self.verification.total_edges_submitted,
                 "judge_calls": self.verification.total_judge_calls,
@@ -377,12 +712,12 @@ class PipelineTelemetry:
                 "exhausted_iterations": self.verification.exhausted_iterations_count,
                 "duplicate_query_breaks": self.verification.duplicate_query_breaks,
                 "adversarial_rejections": self.verification.adversarial_rejections,
-                "avg_verdict_confidence": round(
-                    sum(self.verification.verdict_confidences)
-                    / max(len(self.verification.verdict_confidences), 1),
-                    3,
-                ),
-                "rejection_reasons": self.verification.rejection_reasons[:50],
+                "adversarial_skipped": self.verification.adversarial_skipped,
+                "evidence_truncated": self.verification.evidence_truncated,
+                "escalations": self.verification.escalations,
+                "empty_evidence_skipped": self.verification.empty_evidence_skipped,
+                "avg_verdict_confidence": round(avg_confidence, 3),
+                "rejection_reasons": self.verification.rejection_reasons.rows(50),
             },
             "var_id_resolve_misses": self.var_id_resolve_misses[:30],
             "evidence_cache_size": self.evidence_cache_size,
@@ -393,95 +728,82 @@ class PipelineTelemetry:
 
         Returns the absolute path written.
         """
+        from pathlib import Path
+
         out = Path(path)
         out.parent.mkdir(parents=True, exist_ok=True)
 
-        payload = {
-            "summary": self.summary(),
-            "pywhyllm_raw_outputs": self.pywhyllm.raw_outputs,
-            "events": [
-                {
-                    "stage": ev.stage,
-                    "event": ev.event,
-                    "wall_clock": ev.wall_clock,
-                    "elapsed_since_start": round(ev.timestamp - self.run_start, 3),
-                    "data": ev.data,
-                }
-                for ev in self.events
-            ],
-        }
-
+        # Events carry pre-serialised ``data_json`` blobs, so the file is
+        # framed by hand and streamed one event at a time — peak memory
+        # stays O(1) in the number of events.
+        run_start_dt = self._run_start_datetime()
         abs_path = str(out.resolve())
-        with open(abs_path, "w") as f:
-            json.dump(payload, f, indent=2, default=str)
+        with open(abs_path, "wb", buffering=_DUMP_BUFFER_BYTES) as f:
+            f.write(b'{"summary":')
+            f.write(orjson.dumps(self.summary(), option=_DUMP_OPTIONS, default=str))
+            f.write(b',"pywhyllm_raw_outputs":')
+            f.write(orjson.dumps(
+                self.pywhyllm.raw_outputs.rows(), option=_DUMP_OPTIONS, default=str,
+            ))
+            f.write(b',"events":[')
+            sep = b"\n"
+            for ev in self.events:
+                f.write(sep)
+                f.write(self._event_json(ev, run_start_dt))
+                sep = b",\n"
+            f.write(b"\n]}\n")
 
         _logger.info("[TELEMETRY] Full telemetry dumped to %s", abs_path)
         return abs_path
 
+    def _event_json(self, ev: TelemetryEvent, run_start_dt: datetime) -> bytes:
+        """Serialise one event, splicing in its pre-encoded ``data_json``."""
+        from datetime import timedelta
+
+        elapsed_ns = ev.timestamp - self.run_start_ns
+        elapsed = elapsed_ns / 1e9
+        wall_clock = run_start_dt + timedelta(microseconds=elapsed_ns // 1000)
+        head = orjson.dumps({
+            "stage": ev.stage,
+            "event": ev.event,
+            "wall_clock": wall_clock.isoformat(timespec="milliseconds"),
+            "elapsed_since_start": round(elapsed, 3),
+        })
+        return head[:-1] + b',"data":' + ev.data_json + b"}"
+
+    def summary_flat(self) -> dict[str, Any]:
+        """``summary()`` flattened to ``"section.key"`` entries.
+
+        Feeds the ``%``-style ``_SUMMARY_TEMPLATE``; top-level scalars
+        keep their own name.
+        """
+        flat: dict[str, Any] = {}
+        for section, value in self.summary().items():
+            if isinstance(value, dict):
+                for key, item in value.items():
+                    flat[f"{section}.{key}"] = item
+            flat[section] = value
+        return flat
+
     def print_summary(self) -> str:
         """Return a human-readable summary string."""
-        s = self.summary()
+        flat = self.summary_flat()
+        total = flat["total_run_seconds"]
         lines = [
             "=" * 72,
             " PIPELINE TELEMETRY SUMMARY",
             "=" * 72,
-            f"Total run time:    {s['total_run_seconds']:.1f}s",
+            "Total run time:    %.1fs" % total,
             "",
             "── Stage Durations ──",
         ]
-        for stage, dur in s["stage_durations_seconds"].items():
-            pct = (dur / max(s["total_run_seconds"], 0.001)) * 100
-            lines.append(f"  {stage:30s}  {dur:8.1f}s  ({pct:5.1f}%)")
+        for stage, dur in flat["stage_durations_seconds"].items():
+            pct = (dur / max(total, 0.001)) * 100
+            lines.append("  %-30s  %8.1fs  (%5.1f%%)" % (stage, dur, pct))
 
-        lines += [
-            "",
-            "── Variables ──",
-            f"  Raw discovered:          {s['variables']['raw_discovered']}",
-            f"  After canonicalization:  {s['variables']['after_canonicalization']}",
-            f"  Added to engine:         {s['variables']['added_to_engine']}",
-            "",
-            "── LLM Calls ──",
-            f"  Total calls:     {s['llm_calls']['total']}",
-            f"  By model:        {s['llm_calls']['by_model']}",
-            f"  Avg latency:     {s['llm_calls']['avg_latency_ms']:.0f}ms",
-            f"  Retries:         {s['llm_calls']['retries']}",
-            f"  Errors:          {s['llm_calls']['errors']}",
-            f"  Quota errors:    {s['llm_calls']['quota_errors']}",
-            f"  Fallbacks:       {s['llm_calls']['fallbacks_to_prompt_injection']}",
-            "",
-            "── PyWhyLLM Pairwise ──",
-            f"  Total pairs:     {s['pywhyllm_pairwise']['total_pairs']}",
-            f"  A (var1→var2):   {s['pywhyllm_pairwise']['edges_found_A']}",
-            f"  B (var2→var1):   {s['pywhyllm_pairwise']['edges_found_B']}",
-            f"  C (no relation): {s['pywhyllm_pairwise']['no_relationship_C']}",
-            f"  Parse failures:  {s['pywhyllm_pairwise']['parse_failures']}",
-            f"  Exceptions:      {s['pywhyllm_pairwise']['exceptions']}",
-            f"  Avg latency:     {s['pywhyllm_pairwise']['avg_latency_ms']:.0f}ms",
-            "",
-            "── Edge Dropout Cascade ──",
-            f"  PyWhyLLM proposed:           {s['edge_dropout']['pywhyllm_proposed']}",
-            f"  LangExtract proposed:        {s['edge_dropout']['langextract_proposed']}",
-            f"  After dedup:                 {s['edge_dropout']['total_after_dedup']}",
-            f"  Submitted to verification:   {s['edge_dropout']['submitted_to_verification']}",
-            f"  Grounded by verification:    {s['edge_dropout']['grounded_by_verification']}",
-            f"  Rejected by verification:    {s['edge_dropout']['rejected_by_verification']}",
-            f"  NodeNotFound errors:         {s['edge_dropout']['node_not_found_errors']}",
-            f"  CycleDetected errors:        {s['edge_dropout']['cycle_detected_errors']}",
-            f"  Other add errors:            {s['edge_dropout']['other_add_errors']}",
-            f"  Final edges in graph:        {s['edge_dropout']['final_edges_in_graph']}",
-            "",
-            "── Verification ──",
-            f"  Judge calls:             {s['verification']['judge_calls']}",
-            f"  Adversarial calls:       {s['verification']['adversarial_calls']}",
-            f"  Grounded:                {s['verification']['grounded']}",
-            f"  Rejected:                {s['verification']['rejected']}",
-            f"  No evidence:             {s['verification']['no_evidence_retrievals']}",
-            f"  Exhausted iterations:    {s['verification']['exhausted_iterations']}",
-            f"  Avg verdict confidence:  {s['verification']['avg_verdict_confidence']:.3f}",
-            "",
-            "── Var ID Resolve Misses ──",
-            f"  Total: {len(self.var_id_resolve_misses)}",
-        ]
+        # Fixed-shape body: one C-level %-format over the flat summary.
+        lines.append(_SUMMARY_TEMPLATE % flat)
+        lines.append(f"  Total: {len(self.var_id_resolve_misses)}")
         for miss in self.var_id_resolve_misses[:10]:
             lines.append(f"    {miss['raw_id']} → {miss['resolved_id']} ({miss['match_type']})")
 
@@ -493,15 +815,11 @@ class PipelineTelemetry:
 #  Module-level singleton
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-_instance: PipelineTelemetry | None = None
-_instance_lock = Lock()
+# Built at import time so ``get_telemetry()`` is a single global load —
+# no None check or lock on the hot path.
+_INSTANCE: Final[PipelineTelemetry] = PipelineTelemetry()
 
 
 def get_telemetry() -> PipelineTelemetry:
     """Return the process-wide telemetry singleton."""
-    global _instance
-    if _instance is None:
-        with _instance_lock:
-            if _instance is None:
-                _instance = PipelineTelemetry()
-    return _instance
+    return _INSTANCE
@@ -12,6 +12,9 @@ Components:
 
 from src.verification.judge import (
     AdversarialVerdict,
+    BatchedJudgeQueue,
+    CombinedJudgeVerdict,
+    SemanticVerdictCache,
     SupportType,
     VerificationJudge,
     VerificationVerdict,
@@ -21,7 +24,10 @@ from src.verification.loop import VerificationAgent, VerificationResult
 
 __all__ = [
     "AdversarialVerdict",
+    "BatchedJudgeQueue",
+    "CombinedJudgeVerdict",
     "GroundingRetriever",
+    "SemanticVerdictCache",
     "SupportType",
     "VerificationAgent",
     "VerificationJudge",
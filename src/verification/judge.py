@@ -9,14 +9,24 @@ Two judge modes:
     1. **Grounding judge** — "Does this evidence support the claim?"
     2. **Adversarial judge** — "Assume the claim is spurious; find
        alternative explanations."
+
+``evaluate_fused`` runs both in a single call for edges expected to
+need the adversarial pass.
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import hashlib
 import logging
-import textwrap
-from enum import Enum
-from typing import Optional
+import re
+import string
+import threading
+import time
+from collections import OrderedDict
+from enum import StrEnum
+from typing import Any, Callable, Optional, Sequence, TypeVar
 
 from pydantic import BaseModel, Field
 
@@ -30,14 +40,79 @@ except ImportError:
 
 _logger = logging.getLogger(__name__)
 
+# Judge calls run at temperature 0, so an identical (system prompt,
+# prompt, schema, model) tuple yields the same verdict — memoise it.
+_VERDICT_CACHE_SIZE = 2048
+
+# Opt-in semantic cache: paraphrased (cause, effect, mechanism) triples
+# reuse a prior grounding verdict when their embeddings are this close.
+_SEMANTIC_MODEL = "sentence-transformers/all-MiniLM-L6-v2"
+_SEMANTIC_THRESHOLD = 0.92
+_SEMANTIC_CACHE_SIZE = 4096
+_SEMANTIC_CONFIDENCE_DISCOUNT = 0.95   # marks a verdict as cache-derived
+
+# Opt-in request coalescing: judge calls arriving within one window are
+# submitted together as a single Gemini batch job.
+_BATCH_WINDOW_MS = 50
+_MAX_BATCH = 64
+# Verification is interactive: a batch job that has not finished by then
+# is cancelled and its requests re-issued as direct calls.
+_BATCH_TIMEOUT_S = 60.0
+
+# Adversarial pre-gate: edges the devil's-advocate pass cannot usefully
+# scrutinise skip the LLM round-trip (see ``_is_trivially_safe``).
+_MIN_ADVERSARIAL_QUOTE_CHARS = 20
+# Causal verbs, matched as whole words in any regular inflection (see
+# ``_verb_pattern``); irregular forms are listed separately.
+_CAUSAL_VERBS = (
+    "cause", "drive", "lead", "result", "increase", "reduce", "raise",
+    "lower", "affect", "improve", "trigger", "boost", "decrease", "lift",
+    "cut", "influence", "impact", "produce", "generate", "enable",
+    "prevent", "spur", "stimulate", "suppress", "determine", "contribute",
+    "induce", "hurt", "harm", "damage", "erode", "grow", "shrink",
+    "decline", "rise", "fall", "drop", "slow", "accelerate", "amplify",
+    "dampen", "weaken", "strengthen", "limit", "constrain", "inhibit",
+    "block", "attract", "deter", "encourage", "discourage", "motivate",
+    "depress", "expand",
+)
+_IRREGULAR_CAUSAL_FORMS = (
+    "drove", "driven", "led", "grew", "grown", "shrank", "shrunk", "rose",
+    "risen", "fell", "fallen", "cutting", "dropped", "dropping", "spurred",
+    "spurring", "deterred", "deterring",
+)
+# Qualifier tokens ignored when testing two variable names for tautology
+# (``revenue`` vs ``total_revenue``).
+_AGGREGATE_TOKENS = frozenset({
+    "total", "net", "gross", "overall", "aggregate", "sum", "avg", "average", "mean",
+})
+_GATED_ADVERSARIAL_CONFIDENCE = 0.7
+
+# Fused judge: the adversarial half is only kept when grounding clears this.
+_FUSED_ADVERSARIAL_MIN_CONFIDENCE = 0.7
+
+# Two-tier grounding: a fast-model verdict below this confidence is
+# re-judged by the strong model.
+_ESCALATION_CONFIDENCE = 0.6
+
+# Cap on the rendered evidence block; Gemini prefill latency grows with
+# input length, so oversized retrievals are trimmed largest-chunk-first.
+_MAX_EVIDENCE_CHARS = 8000
+_TRUNCATION_MARKER = "…[truncated]"
+
+_V = TypeVar("_V", bound=BaseModel)
+
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 #  Verdict schemas (used as Gemini response_schema)
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
 
-class SupportType(str, Enum):
-    """How the evidence relates to the causal claim."""
+class SupportType(StrEnum):
+    """How the evidence relates to the causal claim.
+
+    A ``StrEnum`` so a member formats as its bare value (``"%s"`` →
+    ``direct_causal``) without an ``Enum.value`` descriptor lookup.
+    """
 
     DIRECT_CAUSAL = "direct_causal"
     CORRELATION_ONLY = "correlation_only"
@@ -79,22 +154,26 @@ class VerificationVerdict(BaseModel):
 
 
 class AdversarialVerdict(BaseModel):
-    """Structured output from the adversarial (devil's advocate) judge."""
+    """Structured output from the adversarial (devil's advocate) judge.
+
+    List fields are tuples so the common empty verdict shares the ``()``
+    singleton instead of allocating three lists.
+    """
 
     still_grounded: bool = Field(
         ...,
         description="True if the causal claim survives adversarial scrutiny",
     )
-    alternative_explanations: list[str] = Field(
-        default_factory=list,
+    alternative_explanations: tuple[str, ...] = Field(
+        default=(),
         description="Plausible non-causal explanations for the observed evidence",
     )
-    assumptions_required: list[str] = Field(
-        default_factory=list,
+    assumptions_required: tuple[str, ...] = Field(
+        default=(),
         description="Assumptions that must hold for the causal claim to be valid",
     )
-    conditions: list[str] = Field(
-        default_factory=list,
+    conditions: tuple[str, ...] = Field(
+        default=(),
         description="Boundary conditions under which the relationship holds",
     )
     confidence: float = Field(
@@ -105,99 +184,247 @@ class AdversarialVerdict(BaseModel):
     )
 
 
+class CombinedJudgeVerdict(BaseModel):
+    """Structured output from the fused grounding + adversarial judge."""
+
+    grounding: VerificationVerdict = Field(
+        ...,
+        description="Step 1: the grounding verdict",
+    )
+    adversarial: Optional[AdversarialVerdict] = Field(
+        default=None,
+        description=(
+            "Step 2: the devil's-advocate verdict; null unless the edge is "
+            "grounded with confidence above 0.7"
+        ),
+    )
+
+
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 #  Prompt templates
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
 
-_GROUNDING_SYSTEM = textwrap.dedent("""\
-    You are a causal-inference verifier.
-    Your task is to determine whether provided evidence TEXT supports
-    a proposed causal relationship.
-
-    Rules:
-    - Accept DIRECT causal evidence (A causes B, A leads to B, A
-      drives B, A results in B) — the evidence must explicitly mention
-      or clearly imply a causal mechanism.
-    - Accept well-established domain knowledge stated in business
-      plans, strategy documents, or industry analyses (e.g. "marketing
-      increases customer acquisition" is a widely accepted causal claim
-      even without a controlled experiment).
-    - Accept evidence describing plans, strategies, or projections that
-      express domain-expert causal beliefs — these are valid for initial
-      model construction even if they lack experimental proof.
-    - If the text only shows two variables co-occurring without ANY
-      implied mechanism or plausible domain-logic connection, classify
-      as "correlation_only" and set is_grounded=false.
-    - If the text is about unrelated topics, classify as "irrelevant"
-      and set is_grounded=false.
-    - When is_grounded=true, extract the EXACT verbatim quote (no
-      paraphrasing) as supporting_quote.
-    - When is_grounded=false and you believe better evidence might exist
-      in the document corpus, suggest a refined search query in
-      suggested_refinement_query.  If you do not believe better evidence
-      exists, leave it null.
-    - Be fair and constructive: for initial graph construction, your
-      primary goal is to identify genuine causal relationships even
-      when evidence is indirect.  Accept claims when the evidence
-      plausibly supports a causal link — err on the side of inclusion
-      with an appropriately calibrated confidence score rather than
-      rejecting borderline cases outright.""")
-
-
-_GROUNDING_TEMPLATE = textwrap.dedent("""\
-    ## Proposed Causal Edge
-    - **Cause variable:** {from_var}
-    - **Effect variable:** {to_var}
-    - **Proposed mechanism:** {mechanism}
-
-    ## Retrieved Evidence Chunks
-    {evidence_block}
-
-    ## Task
-    Does the evidence above explicitly support the claim that
-    **{from_var}** causes **{to_var}** through the mechanism described?
-    Evaluate carefully and respond with a structured verdict.""")
-
-
-_ADVERSARIAL_SYSTEM = textwrap.dedent("""\
-    You are a devil's advocate reviewer for causal claims.
-    Assume the proposed relationship might be spurious and look for
-    reasons why the evidence might be misleading.
-
-    Consider:
-    - Confounding variables that could explain the association
-    - Reverse causation (B causes A instead)
-    - Selection bias in the evidence
-    - Measurement issues
-    - Temporal ordering problems
-
-    IMPORTANT NUANCE — Evidence types have different standards:
-    - **Academic / empirical studies**: require rigorous causal evidence.
-    - **Business plans, projections, strategy documents**: these express
-      domain-expert causal beliefs grounded in industry knowledge.  A
-      business plan stating "marketing drives customer acquisition" is a
-      valid causal claim based on established business logic, even if it
-      is forward-looking.  Do NOT reject claims merely because they come
-      from a planning or strategy document.
-    - **Mission statements and aspirational text**: these are weaker but
-      still signal believed causal relationships.
-
-    Be thorough but fair — if after scrutiny the claim genuinely holds
-    as a reasonable causal belief supported by the evidence context, set
-    still_grounded=true.""")
-
-
-_ADVERSARIAL_TEMPLATE = textwrap.dedent("""\
-    ## Proposed Causal Edge
-    - **Cause variable:** {from_var}
-    - **Effect variable:** {to_var}
-    - **Proposed mechanism:** {mechanism}
-    - **Supporting quote:** {supporting_quote}
-
-    ## Task
-    Assume this causal relationship is spurious.  What alternative
-    explanations could account for the observed evidence?  What
-    assumptions must hold for the causal claim to be valid?""")
+# Written left-aligned (no ``textwrap.dedent`` at import); the snapshot
+# test in tests/test_verification_judge.py pins the exact bytes.
+
+_GROUNDING_SYSTEM = """\
+You are a causal-inference verifier.
+Your task is to determine whether provided evidence TEXT supports
+a proposed causal relationship.
+
+Rules:
+- Accept DIRECT causal evidence (A causes B, A leads to B, A
+  drives B, A results in B) — the evidence must explicitly mention
+  or clearly imply a causal mechanism.
+- Accept well-established domain knowledge stated in business
+  plans, strategy documents, or industry analyses (e.g. "marketing
+  increases customer acquisition" is a widely accepted causal claim
+  even without a controlled experiment).
+- Accept evidence describing plans, strategies, or projections that
+  express domain-expert causal beliefs — these are valid for initial
+  model construction even if they lack experimental proof.
+- If the text only shows two variables co-occurring without ANY
+  implied mechanism or plausible domain-logic connection, classify
+  as "correlation_only" and set is_grounded=false.
+- If the text is about unrelated topics, classify as "irrelevant"
+  and set is_grounded=false.
+- When is_grounded=true, extract the EXACT verbatim quote (no
+  paraphrasing) as supporting_quote.
+- When is_grounded=false and you believe better evidence might exist
+  in the document corpus, suggest a refined search query in
+  suggested_refinement_query.  If you do not believe better evidence
+  exists, leave it null.
+- Be fair and constructive: for initial graph construction, your
+  primary goal is to identify genuine causal relationships even
+  when evidence is indirect.  Accept claims when the evidence
+  plausibly supports a causal link — err on the side of inclusion
+  with an appropriately calibrated confidence score rather than
+  rejecting borderline cases outright."""
+
+
+_GROUNDING_TEMPLATE = """\
+## Proposed Causal Edge
+- **Cause variable:** {from_var}
+- **Effect variable:** {to_var}
+- **Proposed mechanism:** {mechanism}
+
+## Retrieved Evidence Chunks
+{evidence_block}
+
+## Task
+Does the evidence above explicitly support the claim that
+**{from_var}** causes **{to_var}** through the mechanism described?
+Evaluate carefully and respond with a structured verdict."""
+
+
+_ADVERSARIAL_SYSTEM = """\
+You are a devil's advocate reviewer for causal claims.
+Assume the proposed relationship might be spurious and look for
+reasons why the evidence might be misleading.
+
+Consider:
+- Confounding variables that could explain the association
+- Reverse causation (B causes A instead)
+- Selection bias in the evidence
+- Measurement issues
+- Temporal ordering problems
+
+IMPORTANT NUANCE — Evidence types have different standards:
+- **Academic / empirical studies**: require rigorous causal evidence.
+- **Business plans, projections, strategy documents**: these express
+  domain-expert causal beliefs grounded in industry knowledge.  A
+  business plan stating "marketing drives customer acquisition" is a
+  valid causal claim based on established business logic, even if it
+  is forward-looking.  Do NOT reject claims merely because they come
+  from a planning or strategy document.
+- **Mission statements and aspirational text**: these are weaker but
+  still signal believed causal relationships.
+
+Be thorough but fair — if after scrutiny the claim genuinely holds
+as a reasonable causal belief supported by the evidence context, set
+still_grounded=true."""
+
+
+_ADVERSARIAL_TEMPLATE = """\
+## Proposed Causal Edge
+- **Cause variable:** {from_var}
+- **Effect variable:** {to_var}
+- **Proposed mechanism:** {mechanism}
+- **Supporting quote:** {supporting_quote}
+
+## Task
+Assume this causal relationship is spurious.  What alternative
+explanations could account for the observed evidence?  What
+assumptions must hold for the causal claim to be valid?"""
+
+
+_FUSED_SYSTEM = f"""\
+You review a proposed causal edge in two steps and return both
+verdicts in one response.
+
+# Step 1 — grounding
+
+{_GROUNDING_SYSTEM}
+
+# Step 2 — devil's advocate
+
+Only if Step 1 found the edge grounded with confidence above
+{_FUSED_ADVERSARIAL_MIN_CONFIDENCE}; otherwise leave ``adversarial`` null.
+Take the Step 1 supporting quote as the evidence under review.
+
+{_ADVERSARIAL_SYSTEM}"""
+
+
+_FUSED_TEMPLATE = """\
+## Proposed Causal Edge
+- **Cause variable:** {from_var}
+- **Effect variable:** {to_var}
+- **Proposed mechanism:** {mechanism}
+
+## Retrieved Evidence Chunks
+{evidence_block}
+
+## Task
+Step 1: does the evidence above explicitly support the claim that
+**{from_var}** causes **{to_var}** through the mechanism described?
+Step 2: if it does, assume the relationship is spurious.  What
+alternative explanations could account for the supporting quote, and
+what assumptions must hold for the causal claim to be valid?
+Respond with both structured verdicts."""
+
+
+# Templates are split into (literal, slot) parts once at import time, so
+# rendering is a join over the parts rather than a ``str.format`` scan
+# of the whole template on every judge call.
+_TemplateParts = tuple[tuple[str, Optional[str]], ...]
+
+
+def _compile_template(template: str) -> _TemplateParts:
+    """Pre-parse a ``str.format`` template (plain ``{name}`` slots only)."""
+    return tuple(
+        (literal, name) for literal, name, _spec, _conv in string.Formatter().parse(template)
+    )
+
+
+def _render(parts: _TemplateParts, slots: dict[str, str]) -> str:
+    return "".join(
+        literal + slots[name] if name is not None else literal
+        for literal, name in parts
+    )
+
+
+_GROUNDING_PARTS = _compile_template(_GROUNDING_TEMPLATE)
+_ADVERSARIAL_PARTS = _compile_template(_ADVERSARIAL_TEMPLATE)
+_FUSED_PARTS = _compile_template(_FUSED_TEMPLATE)
+
+_NO_EVIDENCE = "(no evidence retrieved)"
+
+
+def _verb_pattern(verbs: Sequence[str], irregular: Sequence[str]) -> re.Pattern[str]:
+    """Whole-word regex over ``verbs`` in base, -s, -ed and -ing form."""
+    forms = set(irregular)
+    for verb in verbs:
+        if verb.endswith("e"):
+            forms.update((verb, verb + "s", verb + "d", verb[:-1] + "ing"))
+        elif verb.endswith("y"):
+            forms.update((verb, verb[:-1] + "ies", verb[:-1] + "ied", verb + "ing"))
+        else:
+            plural = "es" if verb.endswith(("s", "sh", "ch", "x")) else "s"
+            forms.update((verb, verb + plural, verb + "ed", verb + "ing"))
+    alternation = "|".join(sorted(map(re.escape, forms), key=len, reverse=True))
+    return re.compile(rf"\b(?:{alternation})\b")
+
+
+_CAUSAL_VERB_RE = _verb_pattern(_CAUSAL_VERBS, _IRREGULAR_CAUSAL_FORMS)
+_NAME_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def _name_tokens(name: str) -> frozenset[str]:
+    return frozenset(_NAME_TOKEN_RE.findall(name.lower())) - _AGGREGATE_TOKENS
+
+
+def _is_trivially_safe(
+    from_var: str,
+    to_var: str,
+    mechanism: str,
+    supporting_quote: str,
+) -> bool:
+    """Whether the adversarial judge can be skipped for this edge.
+
+    True when there is too little for a devil's advocate to attack: the
+    supporting quote is (near-)empty, the variable names are the same
+    tokens up to aggregate qualifiers (a likely tautology such as
+    ``revenue → total_revenue``; ``price → price_elasticity`` is not),
+    or the mechanism contains none of the ``_CAUSAL_VERBS`` as a word.
+    """
+    if len((supporting_quote or "").strip()) < _MIN_ADVERSARIAL_QUOTE_CHARS:
+        return True
+    if _name_tokens(from_var) == _name_tokens(to_var):
+        return True
+    return _CAUSAL_VERB_RE.search(mechanism.lower()) is None
+
+
+def _trim_contents(contents: list[str], budget: int) -> list[str]:
+    """Cap chunk contents so their total length fits in ``budget``.
+
+    Water-filling: the shortest contents are kept whole while the rest
+    share what remains equally, so the largest chunks lose the most.
+    """
+    budget = max(budget, 0)
+    remaining = budget
+    cap = max(len(c) for c in contents)
+    pending = len(contents)
+    for length in sorted(len(c) for c in contents):
+        share = remaining // pending
+        if length > share:
+            cap = share
+            break
+        remaining -= length
+        pending -= 1
+    return [
+        c if len(c) <= cap else c[:cap] + _TRUNCATION_MARKER
+        for c in contents
+    ]
 
 
 # ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
@@ -211,19 +438,75 @@ class VerificationJudge:
     Parameters
     ----------
     llm_client:
-        Pre-initialised ``LLMClient`` (shares the global semaphore).
+        Pre-initialised ``LLMClient`` (shares the global semaphore and
+        the process-wide pooled Gemini connection, so judge calls reuse
+        warm TCP/TLS sessions).
     judge_model:
         Which Gemini model to use for judging.  Defaults to
         ``gemini-2.5-pro`` for stronger reasoning.
+    judge_model_fast:
+        First-pass grounding model when ``enable_two_tier`` is on.
+    enable_two_tier:
+        Judge grounding with ``judge_model_fast`` first and escalate to
+        ``judge_model`` only for uncertain verdicts (confidence below
+        ``_ESCALATION_CONFIDENCE``, or ungrounded with a refinement
+        query).  A no-op when both models are the same; the adversarial
+        judge always uses ``judge_model``.
+    enable_cache:
+        Reuse verdicts for byte-identical judge requests (shared across
+        judge instances, LRU-capped at ``_VERDICT_CACHE_SIZE``).
+    enable_semantic_cache:
+        Also reuse grounding verdicts for paraphrased edges, matched by
+        embedding similarity (see ``SemanticVerdictCache``).  Off by
+        default; needs ``sentence-transformers``.
+    enable_batching:
+        Coalesce concurrent judge calls into Gemini batch jobs (see
+        ``BatchedJudgeQueue``).  Off by default: batch jobs trade latency
+        for throughput and are only worth it for large verification runs.
+    batch_window_ms:
+        How long the batching queue waits for more requests.
+    trust_native_schema:
+        Build verdicts from Gemini's schema-constrained JSON with
+        ``model_construct`` (no Pydantic validation) after a cheap sanity
+        check; anything that fails the check is fully validated.
+    max_evidence_chars:
+        Upper bound on the evidence block in a prompt.  Chunk headers
+        (source and location) are always kept; chunk contents are
+        trimmed, largest first, to fit.
     """
 
+    _verdict_cache: OrderedDict[str, BaseModel] = OrderedDict()
+
     def __init__(
         self,
         llm_client: LLMClient,
         judge_model: LLMModel = LLMModel.GEMINI_PRO,
+        judge_model_fast: LLMModel = LLMModel.GEMINI_FLASH,
+        enable_two_tier: bool = True,
+        enable_cache: bool = True,
+        enable_semantic_cache: bool = False,
+        enable_batching: bool = False,
+        batch_window_ms: int = _BATCH_WINDOW_MS,
+        trust_native_schema: bool = True,
+        max_evidence_chars: int = _MAX_EVIDENCE_CHARS,
     ) -> None:
         self.llm = llm_client
         self.judge_model = judge_model
+        self.judge_model_fast = judge_model_fast
+        self.enable_two_tier = enable_two_tier and judge_model_fast != judge_model
+        self.enable_cache = enable_cache
+        self.trust_native_schema = trust_native_schema
+        self.max_evidence_chars = max_evidence_chars
+        self._semantic_cache = SemanticVerdictCache() if enable_semantic_cache else None
+        self._batch_queue = (
+            BatchedJudgeQueue(llm_client, judge_model, window_ms=batch_window_ms)
+            if enable_batching else None
+        )
+
+    async def close(self) -> None:
+        """Stop the batching queue's background drainer, if any."""
+        if self._batch_queue is not None:
+            await self._batch_queue.close()
 
     async def evaluate(
         self,
@@ -235,43 +518,131 @@ class VerificationJudge:
         """Run the grounding judge on an edge + evidence.
 
         Returns a ``VerificationVerdict`` with the judge's assessment.
+        With no evidence there is nothing to judge: an ungrounded
+        ``irrelevant`` verdict is returned without an LLM call.
         """
-        import time as _time
-        evidence_block = self._format_evidence(evidence_chunks)
-
-        prompt = _GROUNDING_TEMPLATE.format(
-            from_var=from_var,
-            to_var=to_var,
-            mechanism=mechanism,
-            evidence_block=evidence_block,
+        if not evidence_chunks:
+            return self._no_evidence_verdict(from_var, to_var)
+        prompt, evidence_block = self._grounding_prompt(
+            from_var, to_var, mechanism, evidence_chunks,
         )
-
-        full_prompt_chars = len(prompt) + len(_GROUNDING_SYSTEM)
-        _logger.info(
-            "[TELEMETRY] Judge evaluate %s→%s: prompt_chars=%d est_tokens=%d "
-            "evidence_chunks=%d evidence_block_chars=%d",
-            from_var, to_var, full_prompt_chars, full_prompt_chars // 4,
-            len(evidence_chunks), len(evidence_block),
+        return await self._evaluate_one(
+            from_var, to_var, mechanism, prompt,
+            len(evidence_chunks), evidence_block,
         )
-        _jt0 = _time.monotonic()
 
-        verdict = await self.llm.generate_structured_native(
-            prompt=prompt,
-            output_schema=VerificationVerdict,
-            system_prompt=_GROUNDING_SYSTEM,
-            model_override=self.judge_model,
-        )
+    async def evaluate_many(
+        self,
+        items: list[tuple[str, str, str, list[EvidenceBundle]]],
+    ) -> list[VerificationVerdict]:
+        """Run the grounding judge on many edges concurrently.
+
+        ``items`` are ``(from_var, to_var, mechanism, evidence_chunks)``
+        tuples; verdicts come back in the same order.  Concurrency is
+        capped by the ``LLMClient``'s shared semaphore — no extra limit
+        is applied here.
+        """
+        return list(await asyncio.gather(*(self.evaluate(*item) for item in items)))
+
+    def _grounding_prompt(
+        self,
+        from_var: str,
+        to_var: str,
+        mechanism: str,
+        evidence_chunks: list[EvidenceBundle],
+    ) -> tuple[str, str]:
+        """Build the grounding prompt; also returns the evidence block."""
+        evidence_block = self._format_evidence(evidence_chunks, self.max_evidence_chars)
+        prompt = _render(_GROUNDING_PARTS, {
+            "from_var": from_var,
+            "to_var": to_var,
+            "mechanism": mechanism,
+            "evidence_block": evidence_block,
+        })
+        return prompt, evidence_block
+
+    async def _evaluate_one(
+        self,
+        from_var: str,
+        to_var: str,
+        mechanism: str,
+        prompt: str,
+        evidence_chunk_count: int,
+        evidence_block: str,
+    ) -> VerificationVerdict:
+        """One grounding call, with the shared logging / caching path.
+
+        The semantic cache is keyed on the edge triple plus a digest of the
+        evidence block, so a refinement iteration with new evidence never
+        reuses the previous verdict.  Only the final (post-escalation)
+        verdict is stored in it.
+        """
+        # One level check per call: the argument tuples below (attribute
+        # loads, slicing) are otherwise built even when INFO is off.
+        log_info = _logger.isEnabledFor(logging.INFO)
+        if log_info:
+            full_prompt_chars = len(prompt) + len(_GROUNDING_SYSTEM)
+            _logger.info(
+                "[TELEMETRY] Judge evaluate %s→%s: prompt_chars=%d est_tokens=%d "
+                "evidence_chunks=%d evidence_block_chars=%d",
+                from_var, to_var, full_prompt_chars, full_prompt_chars // 4,
+                evidence_chunk_count, len(evidence_block),
+            )
+        _jt0 = time.monotonic()
+
+        semantic = self._semantic_cache
+        semantic_key = f"{from_var}|{to_var}|{mechanism}"
+        evidence_digest = ""
+        verdict: Optional[VerificationVerdict] = None
+        if semantic is not None:
+            evidence_digest = hashlib.sha256(evidence_block.encode()).hexdigest()
+            verdict = await semantic.lookup(semantic_key, evidence_digest)
+            if verdict is not None:
+                _tel = _get_telemetry() if _get_telemetry else None
+                if _tel:
+                    _tel.llm.semantic_cache_hits += 1
+
+        if verdict is None:
+            verdict = await self._judge_two_tier(from_var, to_var, prompt)
+            if semantic is not None:
+                await semantic.add(semantic_key, verdict, evidence_digest)
+
+        if log_info:
+            _jt1 = time.monotonic()
+            ref_preview = (verdict.suggested_refinement_query or "")[:80]
+            _logger.info(
+                "[TELEMETRY] Judge verdict for %s→%s: grounded=%s  type=%s  confidence=%.2f  "
+                "latency=%.1fs  rejection_reason=%r  refinement=%r",
+                from_var, to_var, verdict.is_grounded,
+                verdict.support_type, verdict.confidence,
+                _jt1 - _jt0,
+                verdict.rejection_reason,
+                ref_preview,
+            )
+        return verdict
 
-        _jt1 = _time.monotonic()
-        _logger.info(
-            "[TELEMETRY] Judge verdict for %s→%s: grounded=%s  type=%s  confidence=%.2f  "
-            "latency=%.1fs  rejection_reason=%r  refinement=%r",
-            from_var, to_var, verdict.is_grounded,
-            verdict.support_type.value, verdict.confidence,
-            _jt1 - _jt0,
-            verdict.rejection_reason,
-            (verdict.suggested_refinement_query or "")[:80],
+    async def _judge_two_tier(
+        self, from_var: str, to_var: str, prompt: str,
+    ) -> VerificationVerdict:
+        """Fast-tier grounding call, escalated to ``judge_model`` when unsure."""
+        verdict = await self._generate_cached(
+            prompt, VerificationVerdict, _GROUNDING_SYSTEM,
+            model=self.judge_model_fast if self.enable_two_tier else None,
         )
+        if self.enable_two_tier and (
+            verdict.confidence < _ESCALATION_CONFIDENCE
+            or (not verdict.is_grounded and verdict.suggested_refinement_query)
+        ):
+            _tel = _get_telemetry() if _get_telemetry else None
+            if _tel:
+                _tel.verification.escalations += 1
+            _logger.debug(
+                "Escalating %s→%s to %s (fast confidence=%.2f)",
+                from_var, to_var, self.judge_model.value, verdict.confidence,
+            )
+            verdict = await self._generate_cached(
+                prompt, VerificationVerdict, _GROUNDING_SYSTEM,
+            )
         return verdict
 
     async def evaluate_adversarial(
@@ -284,60 +655,529 @@ class VerificationJudge:
         """Run the adversarial (devil's advocate) judge.
 
         Only called for edges that passed the grounding judge with
-        ``evidence_strength=strong``.
+        ``evidence_strength=strong``.  Edges for which the pass cannot
+        add anything (see ``_is_trivially_safe``) get a synthesised
+        ``still_grounded=True`` verdict without an LLM call.
         """
-        import time as _time
-        prompt = _ADVERSARIAL_TEMPLATE.format(
-            from_var=from_var,
-            to_var=to_var,
-            mechanism=mechanism,
-            supporting_quote=supporting_quote or "(no quote extracted)",
-        )
-
         _tel = _get_telemetry() if _get_telemetry else None
+        log_info = _logger.isEnabledFor(logging.INFO)
+        if _is_trivially_safe(from_var, to_var, mechanism, supporting_quote):
+            if _tel:
+                _tel.verification.adversarial_skipped += 1
+            if log_info:
+                _logger.info(
+                    "[TELEMETRY] Adversarial verdict for %s→%s: still_grounded=True  "
+                    "alternatives=0  confidence=%.2f  latency=0.0s  (gated)",
+                    from_var, to_var, _GATED_ADVERSARIAL_CONFIDENCE,
+                )
+            return AdversarialVerdict(
+                still_grounded=True, confidence=_GATED_ADVERSARIAL_CONFIDENCE,
+            )
+
+        prompt = _render(_ADVERSARIAL_PARTS, {
+            "from_var": from_var,
+            "to_var": to_var,
+            "mechanism": mechanism,
+            "supporting_quote": supporting_quote or "(no quote extracted)",
+        })
+
         if _tel:
             _tel.verification.total_adversarial_calls += 1
 
-        _at0 = _time.monotonic()
-        verdict = await self.llm.generate_structured_native(
-            prompt=prompt,
-            output_schema=AdversarialVerdict,
-            system_prompt=_ADVERSARIAL_SYSTEM,
-            model_override=self.judge_model,
+        _at0 = time.monotonic()
+        verdict = await self._generate_cached(
+            prompt, AdversarialVerdict, _ADVERSARIAL_SYSTEM,
         )
-        _at1 = _time.monotonic()
-
-        _logger.info(
-            "[TELEMETRY] Adversarial verdict for %s→%s: still_grounded=%s  "
-            "alternatives=%d  confidence=%.2f  latency=%.1fs",
-            from_var, to_var, verdict.still_grounded,
-            len(verdict.alternative_explanations), verdict.confidence,
-            _at1 - _at0,
+        if log_info:
+            _at1 = time.monotonic()
+            _logger.info(
+                "[TELEMETRY] Adversarial verdict for %s→%s: still_grounded=%s  "
+                "alternatives=%d  confidence=%.2f  latency=%.1fs",
+                from_var, to_var, verdict.still_grounded,
+                len(verdict.alternative_explanations), verdict.confidence,
+                _at1 - _at0,
+            )
+        return verdict
+
+    async def evaluate_fused(
+        self,
+        from_var: str,
+        to_var: str,
+        mechanism: str,
+        evidence_chunks: list[EvidenceBundle],
+    ) -> CombinedJudgeVerdict:
+        """Run the grounding and adversarial judges in one LLM call.
+
+        Halves the round-trips (and rate-limit budget) for edges that
+        would otherwise go through ``evaluate`` then
+        ``evaluate_adversarial``.  ``adversarial`` is ``None`` unless the
+        grounding half is grounded with confidence above
+        ``_FUSED_ADVERSARIAL_MIN_CONFIDENCE``; the threshold is enforced
+        here as well as in the prompt.  Empty evidence short-circuits as
+        in ``evaluate``.
+        """
+        if not evidence_chunks:
+            return CombinedJudgeVerdict(
+                grounding=self._no_evidence_verdict(from_var, to_var),
+            )
+        evidence_block = self._format_evidence(evidence_chunks, self.max_evidence_chars)
+        prompt = _render(_FUSED_PARTS, {
+            "from_var": from_var,
+            "to_var": to_var,
+            "mechanism": mechanism,
+            "evidence_block": evidence_block,
+        })
+        log_info = _logger.isEnabledFor(logging.INFO)
+        if log_info:
+            full_prompt_chars = len(prompt) + len(_FUSED_SYSTEM)
+            _logger.info(
+                "[TELEMETRY] Judge fused evaluate %s→%s: prompt_chars=%d est_tokens=%d "
+                "evidence_chunks=%d evidence_block_chars=%d",
+                from_var, to_var, full_prompt_chars, full_prompt_chars // 4,
+                len(evidence_chunks), len(evidence_block),
+            )
+        _ft0 = time.monotonic()
+
+        verdict = await self._generate_cached(
+            prompt, CombinedJudgeVerdict, _FUSED_SYSTEM,
         )
+        grounding = verdict.grounding
+        if verdict.adversarial is not None and not (
+            grounding.is_grounded
+            and grounding.confidence > _FUSED_ADVERSARIAL_MIN_CONFIDENCE
+        ):
+            verdict = verdict.model_copy(update={"adversarial": None})
+        if verdict.adversarial is not None:
+            _tel = _get_telemetry() if _get_telemetry else None
+            if _tel:
+                _tel.verification.total_adversarial_calls += 1
+
+        if log_info:
+            _ft1 = time.monotonic()
+            adv = verdict.adversarial
+            _logger.info(
+                "[TELEMETRY] Judge fused verdict for %s→%s: grounded=%s  type=%s  "
+                "confidence=%.2f  still_grounded=%s  latency=%.1fs",
+                from_var, to_var, grounding.is_grounded,
+                grounding.support_type, grounding.confidence,
+                None if adv is None else adv.still_grounded,
+                _ft1 - _ft0,
+            )
         return verdict
 
     # ------------------------------------------------------------------ #
     # Helpers
     # ------------------------------------------------------------------ #
 
+    async def _generate_cached(
+        self,
+        prompt: str,
+        output_schema: type[_V],
+        system_prompt: str,
+        model: Optional[LLMModel] = None,
+    ) -> _V:
+        """``generate_structured_native`` behind the exact-match verdict cache.
+
+        ``model`` defaults to ``judge_model``.
+        """
+        model = model or self.judge_model
+        cache = self._verdict_cache
+        key = ""
+        if self.enable_cache:
+            key = self._cache_key(system_prompt, prompt, output_schema.__name__, model)
+            cached = cache.get(key)
+            if cached is not None:
+                cache.move_to_end(key)
+                _tel = _get_telemetry() if _get_telemetry else None
+                if _tel:
+                    _tel.llm.cache_hits += 1
+                _logger.debug("Judge cache hit for %s", output_schema.__name__)
+                return cached.model_copy()  # type: ignore[return-value]
+
+        if self._batch_queue is not None:
+            verdict = await self._batch_queue.submit(
+                prompt, system_prompt, output_schema, model_override=model,
+            )
+        else:
+            raw = await self.llm.generate_structured_native(
+                prompt=prompt,
+                output_schema=output_schema,
+                system_prompt=system_prompt,
+                model_override=model,
+                skip_validation=self.trust_native_schema,
+            )
+            verdict = (
+                raw if isinstance(raw, BaseModel)
+                else self._construct_trusted(output_schema, raw)
+            )
+        if self.enable_cache:
+            cache[key] = verdict.model_copy()
+            if len(cache) > _VERDICT_CACHE_SIZE:
+                cache.popitem(last=False)
+        return verdict
+
+    @staticmethod
+    def _no_evidence_verdict(from_var: str, to_var: str) -> VerificationVerdict:
+        """Synthesised verdict for an edge with no retrieved evidence."""
+        _tel = _get_telemetry() if _get_telemetry else None
+        if _tel:
+            _tel.verification.empty_evidence_skipped += 1
+        _logger.debug("Judge skipped %s→%s: no evidence retrieved", from_var, to_var)
+        return VerificationVerdict.model_construct(
+            is_grounded=False,
+            support_type=SupportType.IRRELEVANT,
+            supporting_quote=None,
+            rejection_reason="no_evidence_retrieved",
+            confidence=0.0,
+            suggested_refinement_query=None,
+        )
+
     @staticmethod
-    def _format_evidence(chunks: list[EvidenceBundle]) -> str:
-        """Format evidence chunks into a numbered block for the prompt."""
+    def _construct_trusted(output_schema: type[_V], raw: dict[str, Any]) -> _V:
+        """Build a verdict from schema-constrained JSON, skipping validation.
+
+        Gemini enforces field presence and types but not Pydantic's
+        ``ge``/``le`` bounds or enum coercion, so those are checked here;
+        on any mismatch the slow ``model_validate`` path takes over.
+        Nested schemas (``CombinedJudgeVerdict``) are always validated.
+        """
+        if output_schema is CombinedJudgeVerdict:
+            return output_schema.model_validate(raw)
+        fields = output_schema.model_fields
+        try:
+            data = {k: v for k, v in raw.items() if k in fields}
+            if any(f.is_required() and name not in data for name, f in fields.items()):
+                raise ValueError("missing required field")
+            if not 0.0 <= float(data["confidence"]) <= 1.0:
+                raise ValueError("confidence out of range")
+            if "support_type" in data:
+                data["support_type"] = SupportType(data["support_type"])
+            for name, value in data.items():
+                if type(value) is list:     # JSON arrays → tuple[str, ...] fields
+                    data[name] = tuple(value)
+            return output_schema.model_construct(**data)
+        except (KeyError, TypeError, ValueError):
+            return output_schema.model_validate(raw)
+
+    @staticmethod
+    def _cache_key(
+        system_prompt: str, prompt: str, schema_name: str, model: LLMModel,
+    ) -> str:
+        h = hashlib.sha256(system_prompt.encode())
+        for part in (prompt, schema_name, model.value):
+            h.update(b"\x00")
+            h.update(part.encode())
+        return h.hexdigest()
+
+    @staticmethod
+    def _format_evidence(
+        chunks: list[EvidenceBundle],
+        max_chars: Optional[int] = None,
+    ) -> str:
+        """Format evidence chunks into a numbered block for the prompt.
+
+        With ``max_chars`` the block is kept within that many characters
+        (unless the chunk headers alone exceed it): every content is
+        capped at one common length, chosen so the shortest chunks stay
+        whole, and a trimmed content ends with ``_TRUNCATION_MARKER``.
+        """
         if not chunks:
-            return "(no evidence retrieved)"
-
-        parts: list[str] = []
-        for i, chunk in enumerate(chunks, 1):
-            source = chunk.source.doc_title or chunk.source.doc_id
-            loc_parts: list[str] = []
-            if chunk.location.page_number:
-                loc_parts.append(f"p.{chunk.location.page_number}")
-            if chunk.location.section_name:
-                loc_parts.append(chunk.location.section_name)
-            loc = ", ".join(loc_parts) if loc_parts else "unknown location"
-
-            parts.append(
-                f"### Chunk {i} [{source} — {loc}]\n{chunk.content}\n"
-            )
+            return _NO_EVIDENCE
+        headers = [
+            f"### Chunk {i} [{c.source.doc_title or c.source.doc_id} — "
+            f"{c.location.display}]\n"
+            for i, c in enumerate(chunks, 1)
+        ]
+        contents = [c.content for c in chunks]
+        if max_chars is not None:
+            fixed = sum(len(h) + 2 for h in headers) - 1   # "\n" after each + joins
+            total = fixed + sum(len(c) for c in contents)
+            if total > max_chars:
+                contents = _trim_contents(
+                    contents, max_chars - fixed - len(_TRUNCATION_MARKER) * len(contents),
+                )
+                _tel = _get_telemetry() if _get_telemetry else None
+                if _tel:
+                    _tel.verification.evidence_truncated += 1
+                _logger.debug(
+                    "Evidence block trimmed from %d to ≤%d chars", total, max_chars,
+                )
+        return "\n".join(f"{h}{c}\n" for h, c in zip(headers, contents))
 
-        return "\n".join(parts)
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  Semantic verdict cache
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class SemanticVerdictCache:
+    """Embedding-similarity cache of grounding verdicts.
+
+    Keys (``"cause|effect|mechanism"``) are embedded with a local
+    sentence-transformer and kept, L2-normalised, in a fixed-size ring
+    buffer, each tagged with a digest of the evidence it was judged on; a
+    lookup is one matrix-vector product over the entries with the same
+    digest.  A hit at cosine similarity ≥ ``threshold`` returns a copy of
+    the stored verdict with its confidence discounted, so downstream code
+    can tell it apart.
+
+    If ``sentence-transformers`` / ``numpy`` are unavailable the cache
+    disables itself and every lookup misses.
+
+    Parameters
+    ----------
+    encoder:
+        Optional ``str -> vector`` callable; defaults to MiniLM-L6-v2,
+        loaded lazily on first use.
+    """
+
+    def __init__(
+        self,
+        threshold: float = _SEMANTIC_THRESHOLD,
+        max_entries: int = _SEMANTIC_CACHE_SIZE,
+        encoder: Optional[Callable[[str], Sequence[float]]] = None,
+    ) -> None:
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._encoder = encoder
+        self._np: Any = None
+        self._index: Any = None          # (max_entries, dim) float32
+        self._verdicts: list[Optional[VerificationVerdict]] = [None] * max_entries
+        self._digests: list[str] = [""] * max_entries
+        self._size = 0
+        self._next = 0
+        self._disabled = False
+        # _embed runs on to_thread workers; load the model only once.
+        self._ready_lock = threading.Lock()
+
+    def _ensure_ready(self) -> bool:
+        if self._np is not None:
+            return True
+        with self._ready_lock:
+            return self._load()
+
+    def _load(self) -> bool:
+        if self._disabled:
+            return False
+        if self._np is not None:
+            return True
+        try:
+            import numpy as np
+            if self._encoder is None:
+                from sentence_transformers import SentenceTransformer
+                model = SentenceTransformer(_SEMANTIC_MODEL)
+                self._encoder = lambda text: model.encode(
+                    [text], normalize_embeddings=True,
+                )[0]
+        except ImportError as exc:
+            _logger.warning("Semantic verdict cache disabled — %s", exc)
+            self._disabled = True
+            return False
+        self._np = np
+        return True
+
+    def _embed(self, text: str) -> Any:
+        if not self._ensure_ready():
+            return None
+        np = self._np
+        vec = np.asarray(self._encoder(text), dtype=np.float32)
+        norm = float(np.linalg.norm(vec))
+        return vec / norm if norm else vec
+
+    async def lookup(
+        self, key: str, evidence_digest: str = "",
+    ) -> Optional[VerificationVerdict]:
+        """Return a discounted copy of the closest verdict, or ``None``.
+
+        Only entries stored with the same ``evidence_digest`` are candidates.
+        """
+        if self._disabled:
+            return None
+        rows = [i for i in range(self._size) if self._digests[i] == evidence_digest]
+        if not rows:
+            return None
+        # Snapshot the candidates: a concurrent add() may overwrite these
+        # ring slots while the key is being embedded.
+        candidates = self._index[rows]          # fancy indexing copies
+        verdicts = [self._verdicts[i] for i in rows]
+        q = await asyncio.to_thread(self._embed, key)
+        if q is None:
+            return None
+        sims = candidates @ q
+        best = int(sims.argmax())
+        if float(sims[best]) < self.threshold:
+            return None
+        verdict = verdicts[best]
+        assert verdict is not None
+        return verdict.model_copy(update={
+            "confidence": verdict.confidence * _SEMANTIC_CONFIDENCE_DISCOUNT,
+        })
+
+    async def add(
+        self, key: str, verdict: VerificationVerdict, evidence_digest: str = "",
+    ) -> None:
+        """Store ``verdict`` under ``key``, overwriting the oldest entry when full."""
+        vec = await asyncio.to_thread(self._embed, key)
+        if vec is None:
+            return
+        if self._index is None:
+            self._index = self._np.zeros((self.max_entries, vec.shape[0]), dtype=self._np.float32)
+        slot = self._next
+        self._index[slot] = vec
+        self._verdicts[slot] = verdict.model_copy()
+        self._digests[slot] = evidence_digest
+        self._next = (slot + 1) % self.max_entries
+        self._size = min(self._size + 1, self.max_entries)
+
+    def __len__(self) -> int:
+        return self._size
+
+
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+#  Request coalescing
+# ━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+
+class BatchedJudgeQueue:
+    """Coalesces concurrent judge requests into Gemini batch jobs.
+
+    ``submit()`` enqueues a request and awaits its future.  A background
+    drainer collects everything that arrives within ``window_ms`` (up to
+    ``max_batch`` requests), groups it by (system prompt, schema, model) and
+    sends each group through ``LLMClient.generate_structured_batch``.
+    A group of one goes through the ordinary per-call path.  Batch jobs
+    that outlive ``batch_timeout_s`` fall back to direct calls.
+
+    Each batch job takes one slot of the ``LLMClient`` semaphore while it
+    is created, so a coalesced group counts as a single request against
+    the concurrency limit.
+
+    The drainer is bound to the running event loop and restarted if the
+    queue is used from a new one.  ``close()`` cancels it together with
+    any in-flight dispatches; their callers see ``CancelledError``.
+    """
+
+    def __init__(
+        self,
+        llm_client: LLMClient,
+        judge_model: LLMModel,
+        window_ms: int = _BATCH_WINDOW_MS,
+        max_batch: int = _MAX_BATCH,
+        batch_timeout_s: float = _BATCH_TIMEOUT_S,
+    ) -> None:
+        self.llm = llm_client
+        self.judge_model = judge_model
+        self.window_s = window_ms / 1000
+        self.max_batch = max_batch
+        self.batch_timeout_s = batch_timeout_s
+        self._queue: Optional[asyncio.Queue] = None
+        self._drainer_task: Optional[asyncio.Task] = None
+        self._inflight: set[asyncio.Task] = set()
+
+    async def submit(
+        self,
+        prompt: str,
+        system_prompt: str,
+        output_schema: type[_V],
+        model_override: Optional[LLMModel] = None,
+    ) -> _V:
+        """Queue one structured request and wait for its result.
+
+        ``model_override`` defaults to the queue's ``judge_model``.
+        """
+        loop = asyncio.get_running_loop()
+        task = self._drainer_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._queue = asyncio.Queue()
+            self._drainer_task = loop.create_task(self._drainer())
+        fut: asyncio.Future = loop.create_future()
+        self._queue.put_nowait((
+            prompt, system_prompt, output_schema,
+            model_override or self.judge_model, fut,
+        ))
+        return await fut
+
+    async def close(self) -> None:
+        """Cancel and await the drainer and in-flight dispatches."""
+        tasks = [*self._inflight]
+        if self._drainer_task is not None:
+            tasks.append(self._drainer_task)
+        self._drainer_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        queue, self._queue = self._queue, None
+        while queue is not None and not queue.empty():
+            queue.get_nowait()[4].cancel()
+
+    async def _drainer(self) -> None:
+        queue = self._queue
+        assert queue is not None
+        loop = asyncio.get_running_loop()
+        batch: list = []
+        try:
+            while True:
+                batch = [await queue.get()]
+                deadline = loop.time() + self.window_s
+                while len(batch) < self.max_batch:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+
+                groups: dict[tuple[str, type, LLMModel], list] = {}
+                for item in batch:
+                    groups.setdefault((item[1], item[2], item[3]), []).append(item)
+                for (system_prompt, schema, model), items in groups.items():
+                    task = loop.create_task(self._dispatch(system_prompt, schema, model, items))
+                    self._inflight.add(task)
+                    task.add_done_callback(self._inflight.discard)
+                    # Also covers a dispatch cancelled before its first step.
+                    task.add_done_callback(functools.partial(
+                        self._cancel_futures, [item[4] for item in items],
+                    ))
+                batch = []
+        finally:
+            # Items taken off the queue but not yet handed to a dispatch.
+            self._cancel_futures([item[4] for item in batch])
+
+    @staticmethod
+    def _cancel_futures(futures: list[asyncio.Future], _task: Any = None) -> None:
+        for fut in futures:
+            fut.cancel()        # no-op once a result or exception is set
+
+    async def _dispatch(
+        self, system_prompt: str, schema: type, model: LLMModel, items: list,
+    ) -> None:
+        futures = [item[4] for item in items]
+        try:
+            if len(items) == 1:
+                results = [await self.llm.generate_structured_native(
+                    prompt=items[0][0],
+                    output_schema=schema,
+                    system_prompt=system_prompt,
+                    model_override=model,
+                )]
+            else:
+                _logger.info(
+                    "Submitting %d coalesced %s requests as one batch",
+                    len(items), schema.__name__,
+                )
+                results = await self.llm.generate_structured_batch(
+                    prompts=[item[0] for item in items],
+                    output_schema=schema,
+                    system_prompt=system_prompt,
+                    model_override=model,
+                    timeout_s=self.batch_timeout_s,
+                )
+        except Exception as exc:
+            for fut in futures:
+                if not fut.done():
+                    fut.set_exception(exc)
+            return
+        for fut, result in zip(futures, results):
+            if not fut.done():
+                fut.set_result(result)
@@ -24,7 +24,11 @@ from typing import Optional
 from uuid import UUID
 
 from src.agent.llm_client import LLMClient, LLMModel
-from src.config import VerificationConfig, get_verification_config
+from src.config import (
+    ResolvedVerificationConfig,
+    VerificationConfig,
+    get_verification_config,
+)
 from src.models.causal import EdgeMetadata
 from src.models.enums import EdgeStatus, EvidenceStrength
 from src.models.evidence import EvidenceBundle
@@ -147,14 +151,18 @@ class VerificationAgent:
         llm_client: LLMClient,
         retrieval_router: RetrievalRouter,
         span_collector: Optional[SpanCollector] = None,
-        config: Optional[VerificationConfig] = None,
+        config: Optional[VerificationConfig | ResolvedVerificationConfig] = None,
     ) -> None:
         self.config = config or get_verification_config()
         self.llm = llm_client
         self.spans = span_collector or SpanCollector(enabled=True)
 
         judge_model = LLMModel(self.config.judge_model)
-        self.judge = VerificationJudge(llm_client, judge_model=judge_model)
+        self.judge = VerificationJudge(
+            llm_client,
+            judge_model=judge_model,
+            enable_two_tier=self.config.enable_two_tier_judge,
+        )
         self.retriever = GroundingRetriever(
             retrieval_router, top_k=self.config.retrieval_top_k,
         )
@@ -163,6 +171,10 @@ class VerificationAgent:
     # Public API
     # ------------------------------------------------------------------ #
 
+    async def close(self) -> None:
+        """Release the judge's background resources."""
+        await self.judge.close()
+
     async def verify_edge(
         self,
         from_var: str,
@@ -442,7 +454,7 @@ class VerificationAgent:
                     iteration=state.iteration,
                     is_grounded=verdict.is_grounded,
                     confidence=verdict.confidence,
-                    support_type=verdict.support_type.value,
+                    support_type=verdict.support_type,
                     has_refinement=verdict.suggested_refinement_query is not None,
                     evidence_chunk_count=len(all_chunks),
                     evidence_block_chars=evidence_block_chars,
@@ -451,7 +463,7 @@ class VerificationAgent:
                 "[TELEMETRY] Judge verdict %s iter=%d: grounded=%s type=%s "
                 "confidence=%.2f evidence_chars=%d chunks=%d refinement=%r",
                 state.edge_label, state.iteration,
-                verdict.is_grounded, verdict.support_type.value,
+                verdict.is_grounded, verdict.support_type,
                 verdict.confidence, evidence_block_chars, len(all_chunks),
                 (verdict.suggested_refinement_query or "")[:80],
             )
@@ -459,7 +471,7 @@ class VerificationAgent:
             self.spans.end_span(iter_span, SpanStatus.COMPLETED, {
                 "chunks_retrieved": len(all_chunks),
                 "is_grounded": verdict.is_grounded,
-                "support_type": verdict.support_type.value,
+                "support_type": verdict.support_type,
                 "confidence": verdict.confidence,
                 "has_refinement": verdict.suggested_refinement_query is not None,
             })
@@ -533,9 +545,9 @@ class VerificationAgent:
             supporting_quote=state.final_quote,
             rejection_reason=state.rejection_reason,
             supporting_bundle=state.supporting_bundle,
-            alternative_explanations=adv.alternative_explanations if adv else [],
-            assumptions=adv.assumptions_required if adv else [],
-            conditions=adv.conditions if adv else [],
+            alternative_explanations=list(adv.alternative_explanations) if adv else [],
+            assumptions=list(adv.assumptions_required) if adv else [],
+            conditions=list(adv.conditions) if adv else [],
             iterations_used=state.iteration,
             verdicts=state.verdicts,
         )
@@ -519,6 +519,74 @@ class TestLLMClient:
         
         assert response.content is not None
 
+    @pytest.mark.asyncio
+    async def test_clients_share_gemini_connection_pool(self):
+        """Should reuse one pooled Gemini client per API key."""
+        from src.agent.llm_client import close_shared_clients
+
+        a = LLMClient(api_key="test-key")
+        b = LLMClient(api_key="test-key")
+        await a.initialize()
+        await b.initialize()
+        try:
+            assert a._client is not None
+            assert a._client is b._client
+        finally:
+            close_shared_clients()
+
+    @pytest.mark.asyncio
+    async def test_closed_client_raises(self):
+        """Should refuse calls after close() until re-initialised."""
+        from src.agent.llm_client import close_shared_clients
+
+        client = LLMClient(api_key="test-key")
+        await client.initialize()
+        try:
+            client.close()
+            with pytest.raises(RuntimeError, match="LLMClient is closed"):
+                await client.generate("What is the answer?")
+            await client.initialize()
+            assert client._client is not None
+        finally:
+            close_shared_clients()
+
+    def test_response_schema_memoised_per_model(self):
+        """Should convert each output schema to Gemini form only once."""
+        from unittest.mock import patch
+
+        from src.verification.judge import VerificationVerdict
+
+        with patch.object(
+            VerificationVerdict, "model_json_schema",
+            wraps=VerificationVerdict.model_json_schema,
+        ) as spy:
+            LLMClient._response_schemas.pop(VerificationVerdict, None)
+            first = LLMClient._response_schema(VerificationVerdict)
+            second = LLMClient._response_schema(VerificationVerdict)
+
+        assert first == second
+        assert first["type"] == "OBJECT"
+        assert spy.call_count == 1
+
+        # Callers get private copies: mutating one leaves the memo intact.
+        first["properties"].clear()
+        assert LLMClient._response_schema(VerificationVerdict) == second
+
+    @pytest.mark.parametrize("text, complete", [
+        ('{"a": 1, "b": [1, 2]}', True),
+        ('{"quote": "braces } and ] in a string"}', True),
+        ('{"escaped": "a \\" quote"}', True),
+        ('{"a": 1, "b": [1, 2', False),
+        ('{"quote": "cut off mid-str', False),
+        ('{"a": {"b": 1}', False),
+        ('', False),
+    ])
+    def test_is_complete_json(self, text, complete):
+        """Should flag truncated structured output without parsing it."""
+        from src.agent.llm_client import _is_complete_json
+
+        assert _is_complete_json(text) is complete
+
 
 class TestContextManager:
     """Test context manager."""
@@ -0,0 +1,34 @@
+"""
+Tests for the configuration snapshots
+
+The frozen ``Resolved*`` dataclasses are declared by hand for static
+typing; these tests keep them in step with the pydantic models.
+"""
+
+from dataclasses import fields
+
+import pytest
+
+from src.config import (
+    ResolvedSettings,
+    ResolvedVerificationConfig,
+    Settings,
+    VerificationConfig,
+    get_verification_config,
+)
+
+
+@pytest.mark.parametrize("snapshot, model", [
+    (ResolvedSettings, Settings),
+    (ResolvedVerificationConfig, VerificationConfig),
+])
+def test_snapshot_fields_match_model(snapshot, model):
+    assert {f.name: f.type for f in fields(snapshot)} == {
+        name: field.annotation for name, field in model.model_fields.items()
+    }
+
+
+def test_verification_snapshot_is_frozen():
+    config = get_verification_config()
+    with pytest.raises(AttributeError):
+        config.max_retries = 1  # type: ignore[misc]
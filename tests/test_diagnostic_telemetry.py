@@ -29,7 +29,6 @@ import asyncio
 import itertools
 import json
 import logging
-import math
 import os
 import pathlib
 import time
@@ -52,6 +51,18 @@ REPO_ROOT = pathlib.Path(__file__).resolve().parent.parent
 DIAGNOSTIC_DIR = REPO_ROOT / "diagnostic_output"
 
 
+@pytest.fixture(scope="session")
+def diag_dir() -> tuple[pathlib.Path, str]:
+    """Output directory (created once) and one UTC timestamp for the run."""
+    DIAGNOSTIC_DIR.mkdir(parents=True, exist_ok=True)
+    return DIAGNOSTIC_DIR, datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
+
+
+def _pair_count(n: int) -> int:
+    """Unordered variable pairs, i.e. ``C(n, 2)`` without the general-k path."""
+    return n * (n - 1) // 2
+
+
 # -----------------------------------------------------------------------
 # Helper: create a mock evidence bundle
 # -----------------------------------------------------------------------
@@ -89,7 +100,7 @@ class TestMockLatencyBudget:
         """
         results = []
         for n in [10, 15, 20, 30, 40, 49, 60]:
-            pairs = math.comb(n, 2)
+            pairs = _pair_count(n)
             # Assume 2s per call, 10 workers → effective serial factor
             serial_time_s = pairs * 2.0  # sequential
             parallel_10_time_s = pairs * 2.0 / 10
@@ -119,7 +130,7 @@ class TestMockLatencyBudget:
         print("=" * 80)
 
         # The assertion that proves the hypothesis
-        pairs_49 = math.comb(49, 2)
+        pairs_49 = _pair_count(49)
         assert pairs_49 == 1176, f"Expected C(49,2)=1176, got {pairs_49}"
 
         # At 60 RPM, this alone takes ~20 minutes
@@ -136,7 +147,7 @@ class TestMockLatencyBudget:
         after the P0 fixes (robust parser, lowered threshold, no adversarial).
         """
         n_vars = 49
-        total_pairs = math.comb(n_vars, 2)  # 1176
+        total_pairs = _pair_count(n_vars)  # 1176
 
         # Stage A: PyWhyLLM pairwise — ~3-5% of pairs yield edges
         # (most variable pairs have no causal relationship)
@@ -245,6 +256,44 @@ class TestTelemetryModule:
         assert tel.llm.total_calls == 0
         assert len(tel.events) == 0
 
+    def test_telemetry_reset_drops_stale_queued_events(self):
+        from src.utils.telemetry import TelemetryEvent, get_telemetry
+        tel = get_telemetry()
+        tel.reset()
+        stale = tel.run_start_ns - 1
+        tel._event_q.put_nowait(TelemetryEvent("test", "stale", stale))
+        tel.record("test", "fresh", {})
+        assert [e.event for e in tel.events] == ["fresh"]
+
+    def test_telemetry_flush_reports_timeout(self, monkeypatch, caplog):
+        import threading
+        from src.utils import telemetry
+        tel = telemetry.PipelineTelemetry()
+        monkeypatch.setattr(telemetry, "_FLUSH_TIMEOUT_S", 0.05)
+        gate = threading.Event()
+        ingest = tel._ingest
+
+        def slow_ingest(batch):
+            gate.wait(5)        # hold the drainer
+            ingest(batch)
+
+        tel._ingest = slow_ingest
+        tel.record("test", "slow", {})
+        with caplog.at_level("WARNING", logger=telemetry.__name__):
+            assert tel.flush() is False
+        assert "flush timed out" in caplog.text
+        gate.set()
+        assert tel.flush() is True
+
+    def test_telemetry_record_snapshots_data(self):
+        from src.utils.telemetry import get_telemetry
+        tel = get_telemetry()
+        tel.reset()
+        data = {"n": 1}
+        tel.record("test", "snap", data)
+        data["n"] = 2
+        assert json.loads(tel.events[0].data_json) == {"n": 1}
+
     def test_telemetry_record_events(self):
         from src.utils.telemetry import get_telemetry
         tel = get_telemetry()
@@ -272,6 +321,37 @@ class TestTelemetryModule:
         assert tel.llm.calls_by_model["gemini-2.5-flash"] == 1
         assert tel.llm.calls_by_model["gemini-2.5-pro"] == 1
 
+    def test_telemetry_latency_percentiles(self):
+        from src.utils.telemetry import get_telemetry
+        tel = get_telemetry()
+        tel.reset()
+        for ms in range(1, 101):
+            tel.record_llm_call("gemini-2.5-flash", 100, 50, float(ms))
+        llm = tel.summary()["llm_calls"]
+        assert llm["avg_latency_ms"] == 50.5
+        assert llm["p50_latency_ms"] == 50.5
+        assert llm["p99_latency_ms"] == pytest.approx(99.0, abs=0.1)
+
+    def test_telemetry_concurrent_llm_calls(self):
+        import threading
+        from src.utils.telemetry import get_telemetry
+        tel = get_telemetry()
+        tel.reset()
+
+        def _worker():
+            for _ in range(200):
+                tel.record_llm_call("gemini-2.5-flash", 100, 50, 10.0)
+
+        threads = [threading.Thread(target=_worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert tel.llm.total_calls == 1600
+        assert tel.llm.latency_count == 1600
+        assert tel.summary()["llm_calls"]["avg_latency_ms"] == 10.0
+
     def test_telemetry_pywhyllm_tracking(self):
         from src.utils.telemetry import get_telemetry
         tel = get_telemetry()
@@ -304,6 +384,31 @@ class TestTelemetryModule:
         summary_text = tel.print_summary()
         assert "PIPELINE TELEMETRY SUMMARY" in summary_text
 
+    def test_telemetry_summary_edge_dropout_is_snapshot(self):
+        from src.utils.telemetry import get_telemetry
+        tel = get_telemetry()
+        tel.reset()
+        tel.edge_dropout.final_edges_in_graph = 3
+        dropout = tel.summary()["edge_dropout"]
+        tel.edge_dropout.final_edges_in_graph = 7
+        assert isinstance(dropout, dict)
+        assert dropout["final_edges_in_graph"] == 3
+
+    def test_telemetry_dump_preserves_event_data(self, tmp_path):
+        from src.utils.telemetry import get_telemetry
+        tel = get_telemetry()
+        tel.reset()
+        tel.record("test_stage", "test_event", {"key": "value", "nested": [1, 2]})
+
+        dump_path = str(tmp_path / "test_events.json")
+        tel.dump(dump_path)
+
+        with open(dump_path) as f:
+            data = json.load(f)
+
+        assert data["events"][0]["stage"] == "test_stage"
+        assert data["events"][0]["data"] == {"key": "value", "nested": [1, 2]}
+
     def test_telemetry_verification_tracking(self):
         from src.utils.telemetry import get_telemetry
         tel = get_telemetry()
@@ -316,6 +421,27 @@ class TestTelemetryModule:
         assert tel.verification.grounded_count == 1
         assert tel.verification.rejected_count == 1
 
+    def test_telemetry_raw_outputs_materialized_as_rows(self, tmp_path):
+        from src.utils.telemetry import get_telemetry
+        tel = get_telemetry()
+        tel.reset()
+        tel.record_pywhyllm_pair("x", "y", "A", "x causes y", 12.34)
+        tel.record_verification_final("a", "b", False, "no_evidence", 3)
+
+        assert tel.pywhyllm.raw_outputs.rows() == [{
+            "var1": "x", "var2": "y", "answer_parsed": "A",
+            "raw_description": "x causes y", "latency_ms": 12.3, "error": None,
+        }]
+        assert tel.summary()["verification"]["rejection_reasons"] == [
+            {"edge": "a->b", "reason": "no_evidence", "iterations": 3},
+        ]
+
+        dump_path = str(tmp_path / "raw_outputs.json")
+        tel.dump(dump_path)
+        with open(dump_path) as f:
+            data = json.load(f)
+        assert data["pywhyllm_raw_outputs"][0]["var1"] == "x"
+
 
 # =======================================================================
 #  TEST 3: Live Pipeline Test (requires infrastructure)
@@ -361,7 +487,7 @@ class TestLivePipeline:
 
     @pytest.mark.asyncio
     @pytest.mark.timeout(2400)  # 40 min max
-    async def test_live_world_model_construction(self):
+    async def test_live_world_model_construction(self, diag_dir):
         """Run the full pipeline and capture telemetry.
 
         This reproduces the 49-variable / 12-edge scenario.
@@ -386,12 +512,11 @@ class TestLivePipeline:
         )
 
         # Dump full telemetry
-        DIAGNOSTIC_DIR.mkdir(parents=True, exist_ok=True)
-        ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        tel_path = tel.dump(str(DIAGNOSTIC_DIR / f"telemetry_live_{ts}.json"))
+        out_dir, ts = diag_dir
+        tel_path = tel.dump(str(out_dir / f"telemetry_live_{ts}.json"))
 
         summary = tel.print_summary()
-        summary_path = DIAGNOSTIC_DIR / f"summary_live_{ts}.txt"
+        summary_path = out_dir / f"summary_live_{ts}.txt"
         summary_path.write_text(summary)
 
         print("\n" + summary)
@@ -421,7 +546,7 @@ class TestReducedScalePipeline:
 
     @pytest.mark.asyncio
     @pytest.mark.timeout(600)  # 10 min max
-    async def test_reduced_scale_world_model(self):
+    async def test_reduced_scale_world_model(self, diag_dir):
         from src.utils.telemetry import get_telemetry
         from src.modes.mode1 import Mode1WorldModelConstruction
 
@@ -441,26 +566,28 @@ class TestReducedScalePipeline:
             max_edges=30,
         )
 
-        DIAGNOSTIC_DIR.mkdir(parents=True, exist_ok=True)
-        ts = datetime.now(timezone.utc).strftime("%Y%m%d_%H%M%S")
-        tel.dump(str(DIAGNOSTIC_DIR / f"telemetry_reduced_{ts}.json"))
-
-        summary = tel.print_summary()
-        print("\n" + summary)
+        out_dir, ts = diag_dir
+        tel.dump(str(out_dir / f"telemetry_reduced_{ts}.json"))
 
         s = tel.summary()
 
+        # Summary + diagnostics are collected and emitted in one write
+        out = ["", tel.print_summary()]
+
         # Key diagnostic assertions
-        print(f"\n--- Diagnostic Assertions ---")
-        print(f"PyWhyLLM pairs checked:     {s['pywhyllm_pairwise']['total_pairs']}")
-        print(f"PyWhyLLM parse failures:    {s['pywhyllm_pairwise']['parse_failures']}")
-        print(f"Edges submitted to verify:  {s['edge_dropout']['submitted_to_verification']}")
-        print(f"Edges grounded:             {s['edge_dropout']['grounded_by_verification']}")
-        print(f"Edges rejected:             {s['edge_dropout']['rejected_by_verification']}")
-        print(f"NodeNotFound errors:        {s['edge_dropout']['node_not_found_errors']}")
-        print(f"CycleDetected errors:       {s['edge_dropout']['cycle_detected_errors']}")
-        print(f"Final edges in graph:       {s['edge_dropout']['final_edges_in_graph']}")
-        print(f"Var ID resolve misses:      {len(tel.var_id_resolve_misses)}")
+        out += [
+            "",
+            "--- Diagnostic Assertions ---",
+            f"PyWhyLLM pairs checked:     {s['pywhyllm_pairwise']['total_pairs']}",
+            f"PyWhyLLM parse failures:    {s['pywhyllm_pairwise']['parse_failures']}",
+            f"Edges submitted to verify:  {s['edge_dropout']['submitted_to_verification']}",
+            f"Edges grounded:             {s['edge_dropout']['grounded_by_verification']}",
+            f"Edges rejected:             {s['edge_dropout']['rejected_by_verification']}",
+            f"NodeNotFound errors:        {s['edge_dropout']['node_not_found_errors']}",
+            f"CycleDetected errors:       {s['edge_dropout']['cycle_detected_errors']}",
+            f"Final edges in graph:       {s['edge_dropout']['final_edges_in_graph']}",
+            f"Var ID resolve misses:      {len(tel.var_id_resolve_misses)}",
+        ]
 
         # At 10 vars, we should get some edges
         # The key question is what FRACTION we lose
@@ -469,11 +596,14 @@ class TestReducedScalePipeline:
                 s['edge_dropout']['grounded_by_verification']
                 / s['edge_dropout']['submitted_to_verification']
             )
-            print(f"Verification grounding rate: {grounding_rate:.1%}")
-        
+            out.append(f"Verification grounding rate: {grounding_rate:.1%}")
+
         # Log rejection reasons
-        for r in s['verification']['rejection_reasons'][:20]:
-            print(f"  REJECTED: {r['edge']} — {r['reason']}")
+        out.extend(
+            f"  REJECTED: {r['edge']} — {r['reason']}"
+            for r in s['verification']['rejection_reasons'][:20]
+        )
+        print("\n".join(out))
 
 
 # =======================================================================
@@ -484,73 +614,71 @@ class TestReducedScalePipeline:
 class TestAnswerTagParsing:
     """Verify the _normalize_answer function handles all edge cases."""
 
-    def test_standard_answers(self):
+    @pytest.mark.parametrize("raw, expected", [
+        ("Some reasoning. <answer>A</answer> More text.", "A"),
+        ("Reasoning here. <answer>B</answer> done.", "B"),
+        ("<answer>C</answer>", "C"),
+        ("<answer> A </answer>", "A"),
+        ("<answer> B </answer>", "B"),
+    ], ids=["A-in-text", "B-in-text", "C-bare", "A-padded", "B-padded"])
+    def test_standard_answers(self, raw, expected):
         """Clean A/B/C in tags should parse correctly."""
         from src.causal.pywhyllm_bridge import _normalize_answer
 
-        cases = [
-            ("Some reasoning. <answer>A</answer> More text.", "A"),
-            ("Reasoning here. <answer>B</answer> done.", "B"),
-            ("<answer>C</answer>", "C"),
-            ("<answer> A </answer>", "A"),
-            ("<answer> B </answer>", "B"),
-        ]
-        for raw, expected in cases:
-            result = _normalize_answer(raw)
-            assert result == expected, f"Failed for {raw!r}: got {result!r}, expected {expected!r}"
+        assert _normalize_answer(raw) == expected
 
-    def test_previously_broken_answers(self):
+    def test_repeat_answers_memoised(self):
+        """Identical LLM outputs should be parsed only once."""
+        from src.causal.pywhyllm_bridge import _normalize_answer
+
+        _normalize_answer.cache_clear()
+        for _ in range(3):
+            assert _normalize_answer("No link here. <answer>C</answer>") == "C"
+        info = _normalize_answer.cache_info()
+        assert (info.misses, info.hits) == (1, 2)
+
+    @pytest.mark.parametrize("raw, expected", [
+        # Period inside tags — THIS was the main bug
+        ("My reasoning. <answer>A.</answer>", "A"),
+        # Extra content inside tags
+        ("<answer>A - X causes Y</answer>", "A"),
+        # Newline in tags
+        ("<answer>\nA\n</answer>", "A"),
+        # "Option A" inside tags
+        ("<answer>Option A</answer>", "A"),
+        # B with trailing period
+        ("reasoning <answer>B.</answer> end", "B"),
+        # Double tags — takes first letter from first tag
+        ("Reasoning <answer>A</answer> more <answer>B</answer>", "A"),
+    ], ids=["period", "extra-content", "newlines", "option-prefix", "B-period", "double-tags"])
+    def test_previously_broken_answers(self, raw, expected):
         """These edge cases USED TO silently drop edges — now they're fixed."""
         from src.causal.pywhyllm_bridge import _normalize_answer
 
-        recovered = [
-            # Period inside tags — THIS was the main bug
-            ("My reasoning. <answer>A.</answer>", "A"),
-            # Extra content inside tags
-            ("<answer>A - X causes Y</answer>", "A"),
-            # Newline in tags
-            ("<answer>\nA\n</answer>", "A"),
-            # "Option A" inside tags
-            ("<answer>Option A</answer>", "A"),
-            # B with trailing period
-            ("reasoning <answer>B.</answer> end", "B"),
-            # Double tags — takes first letter from first tag
-            ("Reasoning <answer>A</answer> more <answer>B</answer>", "A"),
-        ]
-        print("\n" + "=" * 60)
-        print("  _normalize_answer() RECOVERED EDGE CASES")
-        print("=" * 60)
-        for raw, expected in recovered:
-            result = _normalize_answer(raw)
-            print(f"  Input:  {raw!r}")
-            print(f"  Result: {result!r}  expected={expected!r}  ✓={result == expected}")
-            print()
-            assert result == expected, (
-                f"_normalize_answer failed for {raw!r}: got {result!r}, expected {expected!r}"
-            )
+        assert _normalize_answer(raw) == expected
 
-    def test_fallback_no_tags(self):
+    @pytest.mark.parametrize("raw, expected", [
+        # Standalone letter at end of reasoning
+        ("After careful analysis, the answer is A.", "A"),
+        ("Based on the evidence, B.", "B"),
+        ("Neither causes the other. C.", "C"),
+    ], ids=["answer-is-A", "trailing-B", "trailing-C"])
+    def test_fallback_no_tags(self, raw, expected):
         """When LLM forgets tags, fallback scans tail for standalone letter."""
         from src.causal.pywhyllm_bridge import _normalize_answer
 
-        # Standalone letter at end of reasoning
-        assert _normalize_answer(
-            "After careful analysis, the answer is A."
-        ) == "A"
-        assert _normalize_answer(
-            "Based on the evidence, B."
-        ) == "B"
-        assert _normalize_answer(
-            "Neither causes the other. C."
-        ) == "C"
-
-    def test_truly_unparseable(self):
+        assert _normalize_answer(raw) == expected
+
+    @pytest.mark.parametrize("raw", [
+        "",
+        "I cannot determine the answer.",
+        "<answer></answer>",
+    ], ids=["empty", "refusal", "empty-tags"])
+    def test_truly_unparseable(self, raw):
         """Genuinely broken output should return empty string."""
         from src.causal.pywhyllm_bridge import _normalize_answer
 
-        assert _normalize_answer("") == ""
-        assert _normalize_answer("I cannot determine the answer.") == ""
-        assert _normalize_answer("<answer></answer>") == ""
+        assert _normalize_answer(raw) == ""
 
     def test_normalized_count_in_telemetry(self):
         """Verify the telemetry tracks normalized answers correctly."""
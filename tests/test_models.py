@@ -183,6 +183,13 @@ class TestEvidenceModels:
         
         loc_with_page = LocationMetadata(page_number=5, section_name="Overview")
         assert loc_with_page.page_number == 5
+
+    def test_location_metadata_display_tracks_fields(self):
+        """LocationMetadata.display should reflect later field updates."""
+        loc = LocationMetadata(page_number=5)
+        assert loc.display == "p.5"
+        loc.section_name = "Overview"
+        assert loc.display == "p.5, Overview"
     
     def test_retrieval_trace_creation(self):
         """Create a valid RetrievalTrace."""
@@ -284,6 +284,39 @@ class TestMode1Phase1:
         assert isinstance(result, Mode1Result)
         assert result.evidence_linked >= 0  # At least 0 evidence cached
 
+    @pytest.mark.asyncio
+    async def test_gather_evidence_overlaps_retrievals(self, mode1):
+        """Per-variable retrievals should run concurrently, keyed in order."""
+        import asyncio
+
+        in_flight = peak = 0
+
+        async def _retrieve(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return []
+
+        class _Retrieval:
+            retrieve = staticmethod(_retrieve)
+
+        mode1.retrieval = _Retrieval()
+        variables = [
+            VariableCandidate(
+                name=f"var_{i}",
+                description="test",
+                var_type=VariableType.CONTINUOUS,
+                measurement_status=MeasurementStatus.MEASURED,
+            )
+            for i in range(5)
+        ]
+        evidence = await mode1._gather_evidence(variables)
+
+        assert list(evidence) == [v.name for v in variables]
+        assert peak > 1
+
     def test_variable_candidate_has_role_field(self):
         """VariableCandidate should support the role field."""
         vc = VariableCandidate(
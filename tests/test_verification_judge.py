@@ -0,0 +1,638 @@
+"""
+Tests for the Verification Judge
+
+Tests cover:
+- Exact-match verdict cache (hits, misses, opt-out)
+- Semantic verdict cache (similarity threshold, ring-buffer bound)
+- Batched judge queue (request coalescing)
+- evaluate_many() fan-out
+- Pre-compiled prompt templates
+- Evidence block formatting and truncation
+- Trusted native-schema construction
+- Adversarial pre-gate
+- Fused grounding + adversarial call
+- Two-tier (fast → strong) grounding escalation
+- Empty-evidence short-circuit
+
+The LLM client is replaced by a small fake that records every request,
+so no API key is needed.
+"""
+
+import asyncio
+
+import pytest
+from uuid import uuid4
+
+from src.agent.llm_client import LLMModel
+from src.models.enums import RetrievalMethod
+from src.models.evidence import (
+    EvidenceBundle,
+    LocationMetadata,
+    RetrievalTrace,
+    SourceReference,
+)
+from src.verification.judge import (
+    AdversarialVerdict,
+    CombinedJudgeVerdict,
+    SemanticVerdictCache,
+    SupportType,
+    VerificationJudge,
+    VerificationVerdict,
+)
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+class _FakeLLM:
+    """Stands in for ``LLMClient``; returns canned structured verdicts."""
+
+    def __init__(self) -> None:
+        self.calls: list[dict] = []
+        self.batches: list[list[str]] = []
+        self.batch_timeouts: list[float] = []
+        self.grounding_confidence = 0.9
+
+    async def generate_structured_native(
+        self, prompt, output_schema, system_prompt=None, model_override=None,
+        skip_validation=False,
+    ):
+        self.calls.append({
+            "prompt": prompt,
+            "output_schema": output_schema,
+            "system_prompt": system_prompt,
+            "model_override": model_override,
+        })
+        adversarial = {"still_grounded": True, "confidence": 0.7}
+        grounding = {
+            "is_grounded": True,
+            "support_type": "direct_causal",
+            "supporting_quote": "price drives demand",
+            "confidence": self.grounding_confidence,
+        }
+        if output_schema is AdversarialVerdict:
+            raw = adversarial
+        elif output_schema is CombinedJudgeVerdict:
+            raw = {"grounding": grounding, "adversarial": adversarial}
+        else:
+            raw = grounding
+        return raw if skip_validation else output_schema.model_validate(raw)
+
+    async def generate_structured_batch(
+        self, prompts, output_schema, system_prompt=None, model_override=None,
+        timeout_s=900.0,
+    ):
+        self.batches.append(list(prompts))
+        self.batch_timeouts.append(timeout_s)
+        return [
+            await self.generate_structured_native(
+                p, output_schema, system_prompt, model_override,
+            )
+            for p in prompts
+        ]
+
+
+def _make_evidence_bundle(content: str) -> EvidenceBundle:
+    """Create a minimal EvidenceBundle for testing."""
+    return EvidenceBundle(
+        bundle_id=uuid4(),
+        content=content,
+        source=SourceReference(doc_id=f"doc_{uuid4().hex[:6]}", doc_title="Plan.pdf"),
+        location=LocationMetadata(section_name="Pricing", page_number=2),
+        retrieval_trace=RetrievalTrace(
+            method=RetrievalMethod.HAYSTACK,
+            query="test query",
+        ),
+    )
+
+
+_QUOTE = "Cutting the price by 10% drove a 15% rise in unit demand."
+
+
+@pytest.fixture(autouse=True)
+def _clear_verdict_cache():
+    VerificationJudge._verdict_cache.clear()
+    yield
+    VerificationJudge._verdict_cache.clear()
+
+
+@pytest.fixture
+def llm():
+    return _FakeLLM()
+
+
+@pytest.fixture
+def evidence():
+    return [_make_evidence_bundle("Lower price drives demand for the product.")]
+
+
+# ---------------------------------------------------------------------------
+# Verdict cache
+# ---------------------------------------------------------------------------
+
+
+class TestVerdictCache:
+    """Identical judge requests are served from the in-process cache."""
+
+    async def test_repeat_evaluate_hits_cache(self, llm, evidence):
+        judge = VerificationJudge(llm)
+        first = await judge.evaluate("price", "demand", "lower price", evidence)
+        second = await judge.evaluate("price", "demand", "lower price", evidence)
+
+        assert len(llm.calls) == 1
+        assert second == first
+        assert second is not first
+
+    async def test_cache_hit_recorded_in_telemetry(self, llm, evidence):
+        from src.utils.telemetry import get_telemetry
+        tel = get_telemetry()
+        tel.reset()
+        judge = VerificationJudge(llm)
+        await judge.evaluate("price", "demand", "lower price", evidence)
+        await judge.evaluate("price", "demand", "lower price", evidence)
+        assert tel.llm.cache_hits == 1
+        assert tel.summary()["llm_calls"]["cache_hits"] == 1
+
+    async def test_different_mechanism_misses(self, llm, evidence):
+        judge = VerificationJudge(llm)
+        await judge.evaluate("price", "demand", "lower price", evidence)
+        await judge.evaluate("price", "demand", "promotion", evidence)
+        assert len(llm.calls) == 2
+
+    async def test_cache_keyed_by_model(self, llm, evidence):
+        await VerificationJudge(
+            llm, enable_two_tier=False,
+        ).evaluate("price", "demand", "m", evidence)
+        await VerificationJudge(
+            llm, judge_model=LLMModel.GEMINI_FLASH, enable_two_tier=False,
+        ).evaluate("price", "demand", "m", evidence)
+        assert len(llm.calls) == 2
+
+    async def test_adversarial_cached_separately(self, llm):
+        judge = VerificationJudge(llm)
+        args = ("price", "demand", "lower price drives demand", _QUOTE)
+        await judge.evaluate_adversarial(*args)
+        verdict = await judge.evaluate_adversarial(*args)
+        assert len(llm.calls) == 1
+        assert isinstance(verdict, AdversarialVerdict)
+
+    async def test_cache_disabled(self, llm, evidence):
+        judge = VerificationJudge(llm, enable_cache=False)
+        await judge.evaluate("price", "demand", "lower price", evidence)
+        await judge.evaluate("price", "demand", "lower price", evidence)
+        assert len(llm.calls) == 2
+        assert not VerificationJudge._verdict_cache
+
+
+class TestSemanticVerdictCache:
+    """Paraphrased edges reuse a prior verdict above the similarity threshold."""
+
+    @pytest.fixture
+    def encoder(self):
+        pytest.importorskip("numpy")
+        # Toy embeddings: the key's first word picks the direction.
+        vectors = {
+            "marketing": [1.0, 0.0, 0.0],
+            "promotion": [0.99, 0.1, 0.0],
+            "weather": [0.0, 1.0, 0.0],
+        }
+        return lambda text: vectors[text.split("|")[2].split()[0]]
+
+    @pytest.fixture
+    def verdict(self):
+        return VerificationVerdict(
+            is_grounded=True,
+            support_type=SupportType.DIRECT_CAUSAL,
+            confidence=0.8,
+        )
+
+    async def test_similar_key_hits_with_discount(self, encoder, verdict):
+        cache = SemanticVerdictCache(encoder=encoder)
+        await cache.add("a|b|marketing drives sales", verdict)
+
+        hit = await cache.lookup("a|b|promotion increases sales")
+        assert hit is not None
+        assert hit.is_grounded
+        assert hit.confidence == pytest.approx(0.8 * 0.95)
+
+    async def test_dissimilar_key_misses(self, encoder, verdict):
+        cache = SemanticVerdictCache(encoder=encoder)
+        await cache.add("a|b|marketing drives sales", verdict)
+        assert await cache.lookup("a|b|weather drives sales") is None
+
+    async def test_ring_buffer_bounded(self, encoder, verdict):
+        cache = SemanticVerdictCache(max_entries=2, encoder=encoder)
+        for key in ("a|b|marketing", "a|b|weather", "a|b|promotion"):
+            await cache.add(key, verdict)
+        assert len(cache) == 2
+
+    async def test_hit_is_a_copy(self, encoder, verdict):
+        cache = SemanticVerdictCache(encoder=encoder)
+        await cache.add("a|b|marketing drives sales", verdict)
+        first = await cache.lookup("a|b|marketing drives sales")
+        first.is_grounded = False
+        second = await cache.lookup("a|b|marketing drives sales")
+        assert second is not first
+        assert second.is_grounded
+
+    async def test_lookup_ignores_slot_overwritten_while_embedding(self, verdict):
+        pytest.importorskip("numpy")
+        import threading
+        gate = threading.Event()
+
+        def encoder(text):
+            if text.startswith("q|"):
+                gate.wait(2)        # hold the lookup inside to_thread
+            return [1.0, 0.0]
+
+        cache = SemanticVerdictCache(max_entries=1, encoder=encoder)
+        await cache.add("a|b|marketing", verdict, "evidence-1")
+        lookup = asyncio.create_task(cache.lookup("q|b|marketing", "evidence-1"))
+        await asyncio.sleep(0.02)
+        other = verdict.model_copy(update={"is_grounded": False})
+        await cache.add("x|y|marketing", other, "evidence-2")
+        gate.set()
+
+        hit = await lookup
+        assert hit is not None
+        assert hit.is_grounded
+
+    @staticmethod
+    def _judge(llm, encoder, **kwargs):
+        judge = VerificationJudge(llm, enable_semantic_cache=True, **kwargs)
+        judge._semantic_cache = SemanticVerdictCache(encoder=encoder)
+        return judge
+
+    async def test_new_evidence_misses(self, llm, encoder):
+        judge = self._judge(llm, encoder, enable_two_tier=False)
+        first = [_make_evidence_bundle("Marketing spend lifted sales.")]
+        await judge.evaluate("a", "b", "marketing drives sales", first)
+
+        await judge.evaluate("a", "b", "promotion increases sales", first)
+        assert len(llm.calls) == 1
+
+        refined = [_make_evidence_bundle("A later campaign showed no sales effect.")]
+        await judge.evaluate("a", "b", "promotion increases sales", refined)
+        assert len(llm.calls) == 2
+
+    async def test_stores_post_escalation_verdict(self, llm, encoder):
+        fast_generate = llm.generate_structured_native
+
+        async def generate(prompt, output_schema, system_prompt=None,
+                           model_override=None, skip_validation=False):
+            llm.grounding_confidence = 0.5 if model_override is LLMModel.GEMINI_FLASH else 0.9
+            return await fast_generate(
+                prompt, output_schema, system_prompt, model_override, skip_validation,
+            )
+
+        llm.generate_structured_native = generate
+        judge = self._judge(llm, encoder)
+        evidence = [_make_evidence_bundle("Marketing spend lifted sales.")]
+        await judge.evaluate("a", "b", "marketing drives sales", evidence)
+        assert len(llm.calls) == 2
+
+        hit = await judge.evaluate("a", "b", "promotion increases sales", evidence)
+        assert len(llm.calls) == 2
+        assert hit.confidence == pytest.approx(0.9 * 0.95)
+
+
+class TestBatchedJudgeQueue:
+    """Concurrent judge calls are coalesced into one batch request."""
+
+    async def test_concurrent_calls_share_one_batch(self, llm, evidence):
+        judge = VerificationJudge(llm, enable_batching=True, batch_window_ms=20)
+        verdicts = await asyncio.gather(*(
+            judge.evaluate("price", "demand", f"mechanism {i}", evidence)
+            for i in range(3)
+        ))
+
+        assert len(llm.batches) == 1
+        assert len(llm.batches[0]) == 3
+        assert all(v.is_grounded for v in verdicts)
+        assert llm.batch_timeouts == [60.0]
+
+    async def test_close_cancels_drainer(self, llm, evidence):
+        judge = VerificationJudge(llm, enable_batching=True, batch_window_ms=5)
+        await judge.evaluate("price", "demand", "lower price", evidence)
+        drainer = judge._batch_queue._drainer_task
+        assert drainer is not None and not drainer.done()
+
+        await judge.close()
+        assert drainer.cancelled()
+
+        # The queue restarts its drainer on next use.
+        judge.enable_cache = False
+        await judge.evaluate("price", "demand", "lower price", evidence)
+        assert len(llm.calls) == 2
+        await judge.close()
+
+    async def test_close_cancels_requests_in_batch_window(self, llm, evidence):
+        judge = VerificationJudge(llm, enable_batching=True, batch_window_ms=1000)
+        pending = asyncio.create_task(
+            judge.evaluate("price", "demand", "lower price", evidence),
+        )
+        await asyncio.sleep(0.02)      # drainer now holds it in its window
+        await judge.close()
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(pending, 1)
+        assert llm.calls == []
+
+    async def test_single_call_bypasses_batch(self, llm, evidence):
+        judge = VerificationJudge(llm, enable_batching=True, batch_window_ms=5)
+        await judge.evaluate("price", "demand", "lower price", evidence)
+        assert llm.batches == []
+        assert len(llm.calls) == 1
+
+    async def test_groups_by_schema(self, llm, evidence):
+        judge = VerificationJudge(llm, enable_batching=True, batch_window_ms=20)
+        grounding, adversarial = await asyncio.gather(
+            judge.evaluate("price", "demand", "m", evidence),
+            judge.evaluate_adversarial(
+                "price", "demand", "lower price increases demand", _QUOTE,
+            ),
+        )
+        assert isinstance(grounding, VerificationVerdict)
+        assert isinstance(adversarial, AdversarialVerdict)
+        assert len(llm.calls) == 2
+        assert {c["output_schema"] for c in llm.calls} == {
+            VerificationVerdict, AdversarialVerdict,
+        }
+        # Each schema forms a group of one: no batch job for either.
+        assert llm.batches == []
+
+    async def test_same_schema_calls_coalesce(self, llm):
+        judge = VerificationJudge(llm, enable_batching=True, batch_window_ms=20)
+        verdicts = await asyncio.gather(
+            judge.evaluate_adversarial(
+                "price", "demand", "lower price increases demand", _QUOTE,
+            ),
+            judge.evaluate_adversarial(
+                "price", "demand", "discounts drive demand", _QUOTE,
+            ),
+        )
+        assert all(isinstance(v, AdversarialVerdict) for v in verdicts)
+        assert len(llm.batches) == 1
+        assert len(llm.batches[0]) == 2
+
+
+class TestEvaluateMany:
+    """evaluate_many() fans grounding calls out concurrently."""
+
+    async def test_returns_verdicts_in_order(self, llm, evidence):
+        judge = VerificationJudge(llm)
+        items = [("price", "demand", f"m{i}", evidence) for i in range(4)]
+        verdicts = await judge.evaluate_many(items)
+
+        assert len(verdicts) == 4
+        assert all(isinstance(v, VerificationVerdict) for v in verdicts)
+        prompts = [c["prompt"] for c in llm.calls]
+        for i in range(4):
+            assert f"**Proposed mechanism:** m{i}" in prompts[i]
+
+    async def test_empty_input(self, llm):
+        assert await VerificationJudge(llm).evaluate_many([]) == []
+
+
+class TestPromptTemplates:
+    """Pre-split templates render exactly like ``str.format``."""
+
+    def test_grounding_matches_format(self):
+        from src.verification.judge import (
+            _GROUNDING_PARTS, _GROUNDING_TEMPLATE, _render,
+        )
+        slots = {
+            "from_var": "price", "to_var": "demand",
+            "mechanism": "{not a slot}", "evidence_block": "chunk",
+        }
+        assert _render(_GROUNDING_PARTS, slots) == _GROUNDING_TEMPLATE.format(**slots)
+
+    @pytest.mark.parametrize("name, digest", [
+        ("_GROUNDING_SYSTEM", "e9fb6365beb048dc9c8defc9c479e7e917c2aaba2b4a329f5cf6b628d61cac73"),
+        ("_GROUNDING_TEMPLATE", "78661ee26ad7b30ed991f47b97e558126b622b921efce3cace9c69f5db078546"),
+        ("_ADVERSARIAL_SYSTEM", "a0d9a6f9e95d9f332e0721958d13d8a61537a101180e897592c27ace4d320c3a"),
+        ("_ADVERSARIAL_TEMPLATE", "c5714a78d5e31a6bff9873490eab4969ee81bac01a65e808521942c0950281a3"),
+    ])
+    def test_prompt_snapshot(self, name, digest):
+        """Prompt text is byte-identical to the reviewed version."""
+        import hashlib
+        import src.verification.judge as judge_module
+
+        text = getattr(judge_module, name)
+        assert hashlib.sha256(text.encode()).hexdigest() == digest
+
+    def test_format_evidence(self, evidence):
+        block = VerificationJudge._format_evidence(evidence)
+        assert block == (
+            "### Chunk 1 [Plan.pdf — p.2, Pricing]\n"
+            "Lower price drives demand for the product.\n"
+        )
+
+    def test_format_no_evidence(self):
+        assert VerificationJudge._format_evidence([]) == "(no evidence retrieved)"
+
+    async def test_prompt_evidence_capped(self, llm):
+        from src.utils.telemetry import get_telemetry
+        tel = get_telemetry()
+        tel.reset()
+        chunks = [
+            _make_evidence_bundle("short chunk"),
+            _make_evidence_bundle("x" * 5000),
+            _make_evidence_bundle("y" * 3000),
+        ]
+        judge = VerificationJudge(llm, max_evidence_chars=2000)
+        await judge.evaluate("price", "demand", "lower price drives demand", chunks)
+
+        prompt = llm.calls[0]["prompt"]
+        overhead = len(judge._grounding_prompt("price", "demand", "lower price drives demand", [])[0])
+        assert len(prompt) <= 2000 + overhead
+        assert "short chunk\n" in prompt          # smallest chunk kept whole
+        assert prompt.count("…[truncated]") == 2
+        assert "Plan.pdf — p.2, Pricing" in prompt
+        assert tel.verification.evidence_truncated == 1
+
+    def test_format_evidence_within_cap_untouched(self, evidence):
+        assert VerificationJudge._format_evidence(evidence, 8000) == (
+            VerificationJudge._format_evidence(evidence)
+        )
+
+    async def test_adversarial_prompt_contains_quote(self, llm):
+        await VerificationJudge(llm).evaluate_adversarial(
+            "price", "demand", "lower price drives demand", _QUOTE,
+        )
+        assert f"**Supporting quote:** {_QUOTE}" in llm.calls[0]["prompt"]
+
+
+class TestTrustedConstruction:
+    """Schema-constrained JSON skips validation unless it looks wrong."""
+
+    def test_construct_coerces_enum(self):
+        verdict = VerificationJudge._construct_trusted(VerificationVerdict, {
+            "is_grounded": False,
+            "support_type": "correlation_only",
+            "confidence": 0.4,
+        })
+        assert verdict.support_type is SupportType.CORRELATION_ONLY
+        assert verdict.supporting_quote is None
+
+    def test_adversarial_lists_become_tuples(self):
+        verdict = VerificationJudge._construct_trusted(AdversarialVerdict, {
+            "still_grounded": False,
+            "alternative_explanations": ["seasonality"],
+            "confidence": 0.3,
+        })
+        assert verdict.alternative_explanations == ("seasonality",)
+        assert verdict.assumptions_required == ()
+        assert AdversarialVerdict.model_validate({
+            "still_grounded": True, "confidence": 0.8, "conditions": ["US only"],
+        }).conditions == ("US only",)
+
+    def test_support_type_formats_as_value(self):
+        assert "%s" % SupportType.DIRECT_CAUSAL == "direct_causal"
+        assert SupportType.IRRELEVANT == "irrelevant"
+
+    def test_out_of_range_falls_back_to_validation(self):
+        from pydantic import ValidationError
+        with pytest.raises(ValidationError):
+            VerificationJudge._construct_trusted(VerificationVerdict, {
+                "is_grounded": True,
+                "support_type": "direct_causal",
+                "confidence": 1.5,
+            })
+
+    async def test_untrusted_judge_requests_validated_models(self, llm, evidence):
+        judge = VerificationJudge(llm, trust_native_schema=False)
+        verdict = await judge.evaluate("price", "demand", "m", evidence)
+        assert isinstance(verdict, VerificationVerdict)
+        assert verdict.support_type is SupportType.DIRECT_CAUSAL
+
+
+class TestAdversarialGate:
+    """Edges with nothing to scrutinise skip the adversarial LLM call."""
+
+    @pytest.mark.parametrize("from_var, to_var, mechanism, quote", [
+        ("price", "demand", "lower price drives demand", "short"),
+        ("revenue", "total_revenue", "revenue drives total revenue", _QUOTE),
+        ("price", "demand", "price and demand co-move", _QUOTE),
+        # Verb stems inside other words are not verbs.
+        ("price", "demand", "price and demand co-move in the execution data", _QUOTE),
+        ("price", "demand", "leadership tracks demand", _QUOTE),
+    ])
+    async def test_trivial_edges_gated(self, llm, from_var, to_var, mechanism, quote):
+        from src.utils.telemetry import get_telemetry
+        tel = get_telemetry()
+        tel.reset()
+        verdict = await VerificationJudge(llm).evaluate_adversarial(
+            from_var, to_var, mechanism, quote,
+        )
+        assert verdict.still_grounded
+        assert verdict.confidence == pytest.approx(0.7)
+        assert llm.calls == []
+        assert tel.verification.adversarial_skipped == 1
+        assert tel.verification.total_adversarial_calls == 0
+
+    @pytest.mark.parametrize("mechanism", [
+        "lower price increases demand",
+        "a price cut raises unit demand",
+        "discounts affect purchase intent",
+        "promotions triggered a demand spike",
+        "better pricing improves conversion",
+    ])
+    async def test_substantive_edge_calls_llm(self, llm, mechanism):
+        await VerificationJudge(llm).evaluate_adversarial(
+            "price", "demand", mechanism, _QUOTE,
+        )
+        assert len(llm.calls) == 1
+
+    async def test_shared_name_token_is_not_tautology(self, llm):
+        await VerificationJudge(llm).evaluate_adversarial(
+            "price", "price_elasticity", "higher price reduces price elasticity", _QUOTE,
+        )
+        assert len(llm.calls) == 1
+
+
+class TestEvaluateFused:
+    """Grounding and adversarial verdicts come back from one call."""
+
+    async def test_single_call_returns_both_verdicts(self, llm, evidence):
+        verdict = await VerificationJudge(llm).evaluate_fused(
+            "price", "demand", "lower price increases demand", evidence,
+        )
+        assert len(llm.calls) == 1
+        assert llm.calls[0]["output_schema"] is CombinedJudgeVerdict
+        assert "Lower price drives demand" in llm.calls[0]["prompt"]
+        assert isinstance(verdict.grounding, VerificationVerdict)
+        assert verdict.grounding.support_type is SupportType.DIRECT_CAUSAL
+        assert isinstance(verdict.adversarial, AdversarialVerdict)
+        assert verdict.adversarial.still_grounded
+
+    async def test_adversarial_dropped_below_threshold(self, llm, evidence):
+        llm.grounding_confidence = 0.6
+        verdict = await VerificationJudge(llm).evaluate_fused(
+            "price", "demand", "lower price increases demand", evidence,
+        )
+        assert verdict.grounding.confidence == pytest.approx(0.6)
+        assert verdict.adversarial is None
+
+
+class TestTwoTierJudge:
+    """Grounding runs on the fast model; uncertain verdicts escalate."""
+
+    async def test_confident_verdict_stays_on_fast_model(self, llm, evidence):
+        await VerificationJudge(llm).evaluate("price", "demand", "m", evidence)
+        assert [c["model_override"] for c in llm.calls] == [LLMModel.GEMINI_FLASH]
+
+    async def test_uncertain_verdict_escalates(self, llm, evidence):
+        from src.utils.telemetry import get_telemetry
+        tel = get_telemetry()
+        tel.reset()
+        llm.grounding_confidence = 0.5
+        await VerificationJudge(llm).evaluate("price", "demand", "m", evidence)
+        assert [c["model_override"] for c in llm.calls] == [
+            LLMModel.GEMINI_FLASH, LLMModel.GEMINI_PRO,
+        ]
+        assert tel.verification.escalations == 1
+
+    async def test_same_model_is_single_tier(self, llm, evidence):
+        llm.grounding_confidence = 0.5
+        await VerificationJudge(
+            llm, judge_model=LLMModel.GEMINI_FLASH,
+        ).evaluate("price", "demand", "m", evidence)
+        assert len(llm.calls) == 1
+
+    async def test_adversarial_uses_strong_model(self, llm):
+        await VerificationJudge(llm).evaluate_adversarial(
+            "price", "demand", "lower price increases demand", _QUOTE,
+        )
+        assert llm.calls[0]["model_override"] is LLMModel.GEMINI_PRO
+
+
+class TestEmptyEvidence:
+    """Edges with no retrieved evidence never reach the LLM."""
+
+    async def test_evaluate_short_circuits(self, llm):
+        from src.utils.telemetry import get_telemetry
+        tel = get_telemetry()
+        tel.reset()
+        verdict = await VerificationJudge(llm).evaluate("price", "demand", "m", [])
+        assert llm.calls == []
+        assert not verdict.is_grounded
+        assert verdict.support_type is SupportType.IRRELEVANT
+        assert verdict.confidence == 0.0
+        assert verdict.rejection_reason == "no_evidence_retrieved"
+        assert tel.verification.empty_evidence_skipped == 1
+
+    async def test_evaluate_many_mixes_empty_items(self, llm, evidence):
+        verdicts = await VerificationJudge(llm).evaluate_many([
+            ("price", "demand", "m", []),
+            ("price", "demand", "m", evidence),
+        ])
+        assert len(llm.calls) == 1
+        assert not verdicts[0].is_grounded
+        assert verdicts[1].is_grounded
+
+    async def test_fused_short_circuits(self, llm):
+        verdict = await VerificationJudge(llm).evaluate_fused("price", "demand", "m", [])
+        assert llm.calls == []
+        assert verdict.adversarial is None
+        assert verdict.grounding.rejection_reason == "no_evidence_retrieved"